@@ -1,6 +1,11 @@
-from discord import Bot, Cog
+from typing import TYPE_CHECKING
+
+from discord import Cog
+
+if TYPE_CHECKING:
+    from .incarn_bot import IncarnBot
 
 
 class Extension(Cog):
-    def __init__(self, bot: Bot) -> None:
+    def __init__(self, bot: "IncarnBot") -> None:
         self.bot = bot
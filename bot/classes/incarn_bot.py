@@ -1,12 +1,37 @@
+import asyncio
 from logging import getLogger
+from pathlib import Path
+from typing import Awaitable, Callable
+from urllib.parse import urlencode
 
-from discord import Activity, ActivityType, AllowedMentions, Bot, Intents
-from tortoise import Tortoise
+from discord import Activity, ActivityType, AllowedMentions, ApplicationContext, Bot, Intents, Interaction
+from tortoise import Tortoise, connections
+from tortoise.backends.base.config_generator import expand_db_url
+from tortoise.utils import generate_schema_for_client
 
-from ..config import CLIENT_CONFIG, DATABASE_CONFIG
+from ..config import CLIENT_CONFIG, DATABASE_CONFIG, DEBUG_CONFIG, WATCHDOG_CONFIG, DatabaseBackend
+from ..utils.command_sync import CommandSync
+from ..utils.guild_settings import GuildSettingsCache
+from ..utils.loop_watchdog import LoopWatchdog
+from ..utils.paginator_manager import PaginatorManager
+from ..utils.read_router import REPLICA_CONNECTION, ReadRouter
 
 log = getLogger(__name__)
 
+# Tortoise keeps a single aiosqlite connection behind a lock, so every write already goes through one writer.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+    "foreign_keys": "ON",
+}
+
+# Seconds to wait for a replica connection, so an unreachable replica falls back well before the interaction expires.
+REPLICA_CONNECT_TIMEOUT = 1.5
+
 
 class IncarnBot(Bot):
     def __init__(self) -> None:
@@ -15,13 +40,41 @@ class IncarnBot(Bot):
         super().__init__(
             command_prefix=CLIENT_CONFIG.prefix,
             intents=intents,
-            owners_ids=CLIENT_CONFIG.owners,
+            owner_ids=CLIENT_CONFIG.owners,
             help_command=None,
             allowed_mentions=AllowedMentions.none(),
             activity=Activity(type=ActivityType.listening, name="/help"),
+            debug_guilds=DEBUG_CONFIG.guilds if DEBUG_CONFIG.enabled else None,
+            auto_sync_commands=False,
         )
 
-    async def setup_database(self) -> None:
+        self.command_sync = CommandSync(self, Path(CLIENT_CONFIG.sync_state_path))
+        self.__commands_synced = False
+
+        self.guild_settings = GuildSettingsCache()
+        self.read_router = ReadRouter(DATABASE_CONFIG.read_after_write)
+        self.paginators = PaginatorManager()
+
+        # Awaited on close while the database is still connected, e.g. to save in-memory state.
+        self.shutdown_hooks: list[Callable[[], Awaitable[None]]] = []
+
+        self.active_commands: dict[asyncio.Task, str] = {}
+        self.watchdog = LoopWatchdog(WATCHDOG_CONFIG.threshold, Path(WATCHDOG_CONFIG.report_path), self.active_commands)
+
+    def get_database_url(self) -> str:
+        if DATABASE_CONFIG.backend == DatabaseBackend.SQLITE:
+            return self.get_sqlite_url()
+        return self.get_postgres_url()
+
+    def get_sqlite_url(self) -> str:
+        path = Path(DATABASE_CONFIG.sqlite_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        log.debug("Attempting to access the SQLite database '%s'", path)
+
+        return f"sqlite://{path}?{urlencode(SQLITE_PRAGMAS)}"
+
+    def get_postgres_url(self) -> str:
         username = DATABASE_CONFIG.username
         password = DATABASE_CONFIG.password
         host = DATABASE_CONFIG.host
@@ -37,20 +90,71 @@ class IncarnBot(Bot):
             password,
         )
 
+        return f"postgres://{username}:{password}@{host}:{port}/{database}"
+
+    def get_database_connections(self) -> dict[str, str | dict]:
+        database_connections: dict[str, str | dict] = {"default": self.get_database_url()}
+        if DATABASE_CONFIG.replica_dsn:
+            log.debug("Read-only queries are routed to the replica")
+            replica = expand_db_url(DATABASE_CONFIG.replica_dsn)
+            if replica["engine"] == "tortoise.backends.asyncpg":
+                replica["credentials"].setdefault("timeout", REPLICA_CONNECT_TIMEOUT)
+            database_connections[REPLICA_CONNECTION] = replica
+        return database_connections
+
+    async def setup_database(self) -> None:
         await Tortoise.init(
-            db_url=f"postgres://{username}:{password}@{host}:{port}/{database}", modules={"models": ["bot.models"]}
+            config={
+                "connections": self.get_database_connections(),
+                "apps": {"models": {"models": ["bot.models"], "default_connection": "default"}},
+            }
         )
-        await Tortoise.generate_schemas()
+        # The replica is read-only and receives the schema through replication.
+        await generate_schema_for_client(connections.get("default"), safe=True)
 
     async def start(self, token: str, *, reconnect: bool = True) -> None:
+        if WATCHDOG_CONFIG.enabled:
+            self.watchdog.start()
         if DATABASE_CONFIG.setup_database:
             await self.setup_database()
+            await self.guild_settings.load()
+            self.guild_settings.start_listening()
         await super().start(token, reconnect=reconnect)
 
     async def close(self) -> None:
+        self.watchdog.stop()
+        self.guild_settings.stop_listening()
+        for hook in list(self.shutdown_hooks):
+            try:
+                await hook()
+            except Exception:
+                log.exception("Shutdown hook %s failed", getattr(hook, "__qualname__", hook))
         await Tortoise.close_connections()
         await super().close()
 
+    async def invoke_application_command(self, ctx: ApplicationContext) -> None:
+        task = asyncio.current_task()
+        if task is None:
+            await super().invoke_application_command(ctx)
+            return
+
+        self.active_commands[task] = ctx.command.qualified_name
+        try:
+            await super().invoke_application_command(ctx)
+        finally:
+            self.active_commands.pop(task, None)
+
+    async def on_interaction(self, interaction: Interaction) -> None:
+        if await self.paginators.rebuild(interaction):
+            return
+        await super().on_interaction(interaction)
+
+    async def on_connect(self) -> None:
+        if self.__commands_synced:
+            return
+        await self.command_sync.sync(push=CLIENT_CONFIG.sync_commands)
+        self.__commands_synced = True
+
     async def on_ready(self) -> None:
         log.info("Incarn is ready.")
 
@@ -1,13 +1,14 @@
 import os
 from dataclasses import dataclass
+from enum import StrEnum
 
 from dotenv import load_dotenv
 
 from .classes.exceptions import InconvertibleVariableError, NoneTypeVariableError
 
 
-def get_env_value(env_name: str) -> str:
-    env_value = os.getenv(env_name)
+def get_env_value(env_name: str, default: str | None = None) -> str:
+    env_value = os.getenv(env_name, default)
 
     if env_value is None:
         message = f"Variable `{env_name}` is None."
@@ -47,12 +48,34 @@ def to_list_int(env_value: str) -> list[int]:
     return [int(item.strip()) for item in env_value.split(",")]
 
 
+class DatabaseBackend(StrEnum):
+    POSTGRES = "postgres"
+    SQLITE = "sqlite"
+
+
+def to_database_backend(env_value: str) -> DatabaseBackend:
+    """
+    Converts the type of the received environment variable to database backend.
+
+    :param str env_value: The value of the environment variable to be converted. Case-insensitive.
+    :return: Value of environment variable of `DatabaseBackend` type.
+    :raises InconvertibleVariableError: A variable is not a supported database backend.
+    """
+    try:
+        return DatabaseBackend(env_value.lower())
+    except ValueError:
+        backends = ", ".join(backend.value for backend in DatabaseBackend)
+        message = f"Cannot convert '{env_value}' to database backend. Supported backends: {backends}."
+        raise InconvertibleVariableError(message) from None
+
+
 @dataclass
 class ClientConfig:
     prefix: str
     token: str
     owners: list[int]
     sync_commands: bool
+    sync_state_path: str
 
 
 @dataclass
@@ -64,14 +87,32 @@ class DebugConfig:
 
 @dataclass
 class DatabaseConfig:
+    backend: DatabaseBackend
     host: str
     port: str
     username: str
     password: str
     database: str
+    replica_dsn: str
+    read_after_write: float
+    sqlite_path: str
     setup_database: bool
 
 
+@dataclass
+class ArchiveConfig:
+    enabled: bool
+    after_days: int
+    batch_size: int
+
+
+@dataclass
+class WatchdogConfig:
+    enabled: bool
+    threshold: float
+    report_path: str
+
+
 load_dotenv()
 
 
@@ -80,6 +121,7 @@ CLIENT_CONFIG = ClientConfig(
     get_env_value("BOT_TOKEN"),
     to_list_int(get_env_value("BOT_OWNERS")),
     to_bool(get_env_value("BOT_SYNC_COMMANDS")),
+    get_env_value("BOT_SYNC_STATE_PATH", "data/command_sync.json"),
 )
 
 
@@ -90,11 +132,32 @@ DEBUG_CONFIG = DebugConfig(
 )
 
 
+DATABASE_BACKEND = to_database_backend(get_env_value("DATABASE_BACKEND", DatabaseBackend.POSTGRES))
+POSTGRES_DEFAULT = None if DATABASE_BACKEND == DatabaseBackend.POSTGRES else ""
+
 DATABASE_CONFIG = DatabaseConfig(
-    get_env_value("POSTGRES_HOST"),
-    get_env_value("POSTGRES_PORT"),
-    get_env_value("POSTGRES_USER"),
-    get_env_value("POSTGRES_PASSWORD"),
-    get_env_value("POSTGRES_DB"),
+    DATABASE_BACKEND,
+    get_env_value("POSTGRES_HOST", POSTGRES_DEFAULT),
+    get_env_value("POSTGRES_PORT", POSTGRES_DEFAULT),
+    get_env_value("POSTGRES_USER", POSTGRES_DEFAULT),
+    get_env_value("POSTGRES_PASSWORD", POSTGRES_DEFAULT),
+    get_env_value("POSTGRES_DB", POSTGRES_DEFAULT),
+    get_env_value("POSTGRES_REPLICA_DSN", ""),
+    float(get_env_value("POSTGRES_READ_AFTER_WRITE_SECONDS", "10")),
+    get_env_value("SQLITE_PATH", "data/incarn.sqlite3"),
     to_bool(get_env_value("SETUP_DATABASE")),
 )
+
+
+ARCHIVE_CONFIG = ArchiveConfig(
+    to_bool(get_env_value("ARCHIVE_ENABLED", "True")),
+    int(get_env_value("ARCHIVE_AFTER_DAYS", "180")),
+    int(get_env_value("ARCHIVE_BATCH_SIZE", "500")),
+)
+
+
+WATCHDOG_CONFIG = WatchdogConfig(
+    to_bool(get_env_value("WATCHDOG_ENABLED", "True")),
+    int(get_env_value("WATCHDOG_THRESHOLD_MS", "250")) / 1000,
+    get_env_value("WATCHDOG_REPORT_PATH", "logs/stalls.log"),
+)
@@ -0,0 +1,122 @@
+import asyncio
+import io
+import threading
+from collections import Counter
+
+from discord import ApplicationContext as AppCtx
+from discord import DiscordException, Embed, File, SlashCommandGroup, option
+from discord.ext.commands import CheckFailure, is_owner
+
+from bot.classes.extension import Extension
+from bot.classes.incarn_bot import IncarnBot
+from bot.utils import SamplingProfiler
+
+MAX_PROFILE_SECONDS = 60
+
+
+class Debug(Extension):
+    debug = SlashCommandGroup("debug", "Diagnostics for the bot owners.")
+
+    def __init__(self, bot: IncarnBot) -> None:
+        super().__init__(bot)
+        self.__profiling = asyncio.Lock()
+
+    def __get_extensions(self) -> dict[str, str]:
+        extensions = {}
+        for command in self.bot.pending_application_commands:
+            if command.cog is None:
+                continue
+
+            extension = command.cog.__module__.rsplit(".", maxsplit=1)[-1]
+            extensions[command.qualified_name] = extension
+            if isinstance(command, SlashCommandGroup):
+                for subcommand in command.walk_commands():
+                    extensions[subcommand.qualified_name] = extension
+        return extensions
+
+    async def cog_command_error(self, ctx: AppCtx, error: DiscordException) -> None:
+        if isinstance(error, CheckFailure):
+            await ctx.respond("Only the bot owners can use this command.", ephemeral=True)
+            return
+        raise error
+
+    @debug.command(name="stalls", description="Shows what blocked the event loop recently.")
+    @option("count", description="Amount of latest reports.", min_value=1, max_value=25)
+    @is_owner()
+    async def debug_stalls(self, ctx: AppCtx, count: int = 5) -> None:
+        watchdog = self.bot.watchdog
+        reports = list(watchdog.reports)[-count:]
+
+        embed = Embed(title="Event loop stalls")
+        embed.add_field(name="Current lag", value=f"{watchdog.lag * 1000:.0f}ms")
+        embed.add_field(name="Max lag", value=f"{watchdog.max_lag * 1000:.0f}ms")
+        embed.add_field(name="Threshold", value=f"{watchdog.threshold * 1000:.0f}ms")
+
+        if not reports:
+            embed.description = "No stalls recorded."
+            await ctx.respond(embed=embed, ephemeral=True)
+            return
+
+        embed.description = "\n".join(
+            f"`{report.started_at:%H:%M:%S}` **{report.duration * 1000:.0f}ms** in "
+            f"`{report.command or report.task or '-'}`"
+            for report in reversed(reports)
+        )
+        content = "\n".join(report.format() for report in reports).encode()
+        await ctx.respond(embed=embed, file=File(io.BytesIO(content), filename="stalls.txt"), ephemeral=True)
+
+    @debug.command(name="profile", description="Profiles the running bot and sends a collapsed stack file.")
+    @option("seconds", description="How long to sample.", min_value=1, max_value=MAX_PROFILE_SECONDS)
+    @is_owner()
+    async def debug_profile(self, ctx: AppCtx, seconds: int = 10) -> None:
+        if self.__profiling.locked():
+            await ctx.respond("A profile is already running.", ephemeral=True)
+            return
+
+        async with self.__profiling:
+            await ctx.defer(ephemeral=True)
+
+            extensions = self.__get_extensions()
+            profiler = SamplingProfiler(
+                asyncio.get_running_loop(), threading.get_ident(), self.bot.active_commands, extensions.get
+            )
+            collapsed = await asyncio.to_thread(profiler.run, seconds)
+
+        commands: Counter[str] = Counter()
+        for stack, count in profiler.samples.items():
+            command = stack.split(";", maxsplit=2)[1].removeprefix("cmd:") if stack.startswith("ext:") else "-"
+            commands[command] += count
+        total = sum(commands.values())
+
+        embed = Embed(title="Profile", description=f"{total} samples in {seconds}s")
+        embed.add_field(
+            name="Commands",
+            value="\n".join(
+                f"`{command}`: {count / total:.1%}" for command, count in commands.most_common(10)
+            ) or "No samples.",
+            inline=False,
+        )
+        await ctx.respond(
+            embed=embed,
+            file=File(io.BytesIO(collapsed.encode()), filename="profile.folded"),
+            ephemeral=True,
+        )
+
+    @debug.command(name="views", description="Shows the live paginators and their estimated memory.")
+    @is_owner()
+    async def debug_views(self, ctx: AppCtx) -> None:
+        manager = self.bot.paginators
+        stats = manager.get_stats()
+
+        embed = Embed(title="Paginators")
+        embed.add_field(name="Live", value=f"{stats['live']}/{manager.max_total}")
+        embed.add_field(name="Users", value=str(stats["users"]))
+        embed.add_field(name="Evicted", value=f"{stats['evicted']}/{manager.max_evicted}")
+        embed.add_field(name="Estimated memory", value=f"{stats['estimated_bytes'] / 1024:.1f} KiB")
+        embed.add_field(name="Per user limit", value=str(manager.max_per_user))
+        embed.add_field(name="Idle timeout", value=f"{manager.timeout:.0f}s")
+        await ctx.respond(embed=embed, ephemeral=True)
+
+
+def setup(bot: IncarnBot) -> None:
+    bot.add_cog(Debug(bot))
@@ -0,0 +1,220 @@
+import asyncio
+from logging import getLogger
+from time import monotonic
+from typing import Any
+
+from bot.models import InitiativeSnapshotModel
+
+from .vtm._health_status import HEALTH_STATUSES, MAX_WOUNDS, HealthStatus
+
+log = getLogger(__name__)
+
+MAX_COMBATANTS = 25
+
+
+class Combatant:
+    __slots__ = ("name", "initiative", "wounds")
+
+    def __init__(self, name: str, initiative: int, wounds: int = 0) -> None:
+        self.name = name
+        self.initiative = initiative
+        self.wounds = wounds
+
+    @property
+    def health_status(self) -> HealthStatus:
+        return HEALTH_STATUSES[self.wounds]
+
+    @property
+    def incapacitated(self) -> bool:
+        return self.wounds >= MAX_WOUNDS
+
+
+class Encounter:
+    """
+    Turn order of one channel, sorted by initiative from highest to lowest.
+
+    `turn` is the index of the combatant who acts now. Every mutation marks the encounter as dirty,
+    so the next snapshot writes it.
+    """
+
+    __slots__ = ("combatants", "turn", "round", "dirty", "touched_at")
+
+    def __init__(self, combatants: list[Combatant] | None = None, turn: int = 0, round: int = 1) -> None:
+        self.combatants = combatants or []
+        self.turn = turn
+        self.round = round
+        self.dirty = False
+        self.touched_at = monotonic()
+
+    @property
+    def current(self) -> Combatant | None:
+        return self.combatants[self.turn] if self.combatants else None
+
+    def find(self, name: str) -> Combatant | None:
+        name = name.casefold()
+        return next((combatant for combatant in self.combatants if combatant.name.casefold() == name), None)
+
+    def add(self, name: str, initiative: int, wounds: int = 0) -> Combatant:
+        """
+        Adds a combatant after everyone with the same or higher initiative, replacing the one with the same name.
+
+        :raises ValueError: The encounter is full.
+        """
+        existing = self.find(name)
+        if existing is None and len(self.combatants) >= MAX_COMBATANTS:
+            message = f"An encounter can have at most {MAX_COMBATANTS} combatants."
+            raise ValueError(message)
+
+        current = self.current
+        if existing is not None:
+            self.combatants.remove(existing)
+
+        combatant = Combatant(name, initiative, wounds)
+        index = next(
+            (index for index, other in enumerate(self.combatants) if other.initiative < initiative),
+            len(self.combatants),
+        )
+        self.combatants.insert(index, combatant)
+        if existing is not None:
+            # The updated combatant keeps the turn if it was theirs.
+            self.turn = self.combatants.index(combatant if current is existing else current)
+        elif index <= self.turn and len(self.combatants) > 1:
+            self.turn += 1
+        self.__touch()
+        return combatant
+
+    def next(self) -> Combatant | None:
+        """
+        Passes the turn to the next combatant who is not incapacitated, starting a new round after the last one.
+        """
+        if not self.combatants:
+            return None
+
+        for _ in range(len(self.combatants)):
+            self.turn += 1
+            if self.turn >= len(self.combatants):
+                self.turn = 0
+                self.round += 1
+            if not self.combatants[self.turn].incapacitated:
+                break
+        self.__touch()
+        return self.current
+
+    def damage(self, combatant: Combatant, amount: int) -> None:
+        combatant.wounds = min(MAX_WOUNDS, combatant.wounds + amount)
+        self.__touch()
+
+    def heal(self, combatant: Combatant, amount: int) -> None:
+        combatant.wounds = max(0, combatant.wounds - amount)
+        self.__touch()
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "turn": self.turn,
+            "round": self.round,
+            "combatants": [[combatant.name, combatant.initiative, combatant.wounds] for combatant in self.combatants],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "Encounter":
+        combatants = [Combatant(name, initiative, wounds) for name, initiative, wounds in state["combatants"]]
+        return cls(combatants, min(state["turn"], max(0, len(combatants) - 1)), state["round"])
+
+    def __touch(self) -> None:
+        self.dirty = True
+        self.touched_at = monotonic()
+
+
+class InitiativeTracker:
+    """
+    Keeps the encounters of all channels in memory, so commands never wait for the database.
+
+    A channel's snapshot is loaded the first time the channel is used. Changed encounters are written
+    every `interval` seconds and on shutdown; encounters that were saved and not used for `idle` seconds
+    are dropped from memory and loaded again when needed.
+    """
+
+    def __init__(self, interval: float = 60, idle: float = 6 * 60 * 60) -> None:
+        self.__interval = interval
+        self.__idle = idle
+        self.__encounters: dict[int, Encounter] = {}
+        self.__loaded: set[int] = set()
+        self.__cleared: set[int] = set()
+        self.__task: asyncio.Task | None = None
+
+    @property
+    def encounters(self) -> int:
+        return len(self.__encounters)
+
+    def start(self) -> None:
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__run(), name="initiative-snapshots")
+
+    def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    def peek(self, channel_id: int) -> Encounter | None:
+        return self.__encounters.get(channel_id)
+
+    async def get(self, channel_id: int) -> Encounter | None:
+        if channel_id in self.__loaded:
+            return self.__encounters.get(channel_id)
+
+        snapshot = await InitiativeSnapshotModel.get_or_none(channel_id=channel_id)
+        self.__loaded.add(channel_id)
+        if snapshot is None:
+            return self.__encounters.get(channel_id)
+        return self.__encounters.setdefault(channel_id, Encounter.from_state(snapshot.state))
+
+    async def get_or_create(self, channel_id: int) -> Encounter:
+        encounter = await self.get(channel_id)
+        if encounter is None:
+            encounter = self.__encounters.setdefault(channel_id, Encounter())
+        return encounter
+
+    def clear(self, channel_id: int) -> None:
+        self.__encounters.pop(channel_id, None)
+        self.__loaded.add(channel_id)
+        self.__cleared.add(channel_id)
+
+    async def save(self) -> None:
+        """
+        Writes every changed encounter and deletes the snapshots of cleared ones.
+        """
+        if self.__cleared:
+            cleared, self.__cleared = self.__cleared, set()
+            try:
+                await InitiativeSnapshotModel.filter(channel_id__in=cleared).delete()
+            except Exception:
+                self.__cleared |= cleared
+                raise
+
+        dirty = [(channel_id, encounter) for channel_id, encounter in self.__encounters.items() if encounter.dirty]
+        for channel_id, encounter in dirty:
+            encounter.dirty = False
+            try:
+                await InitiativeSnapshotModel.update_or_create(
+                    channel_id=channel_id, defaults={"state": encounter.to_state()}
+                )
+            except Exception:
+                encounter.dirty = True
+                raise
+
+        idle_before = monotonic() - self.__idle
+        for channel_id, encounter in list(self.__encounters.items()):
+            if not encounter.dirty and encounter.touched_at < idle_before:
+                del self.__encounters[channel_id]
+                self.__loaded.discard(channel_id)
+
+        if dirty:
+            log.debug("Initiative: saved %s encounters", len(dirty))
+
+    async def __run(self) -> None:
+        while True:
+            await asyncio.sleep(self.__interval)
+            try:
+                await self.save()
+            except Exception:
+                log.exception("Initiative: snapshot failed, retrying with the next one")
@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from math import comb
+
+MAX_SANITY = 45
+
+
+@dataclass(frozen=True)
+class Skill:
+    power: int
+    coin_power: int
+    coins: int
+    sanity: int = 0
+
+    @property
+    def heads_chance(self) -> float:
+        sanity = max(-MAX_SANITY, min(MAX_SANITY, self.sanity))
+        return 0.5 + sanity / 100
+
+
+@dataclass(frozen=True)
+class ClashResult:
+    win_chance: float
+    lose_chance: float
+    stalemate_chance: float
+    damage_dealt: dict[int, float]
+    damage_taken: dict[int, float]
+
+    @staticmethod
+    def expected(distribution: dict[int, float]) -> float:
+        return sum(damage * chance for damage, chance in distribution.items())
+
+
+def get_power_distribution(skill: Skill, coins: int) -> list[tuple[int, float]]:
+    """
+    Returns every possible clash power of a skill with the given amount of coins and its chance.
+    """
+    heads = skill.heads_chance
+    return [
+        (skill.power + skill.coin_power * amount, comb(coins, amount) * heads**amount * (1 - heads) ** (coins - amount))
+        for amount in range(coins + 1)
+    ]
+
+
+def get_round_chances(skill: Skill, coins: int, enemy: Skill, enemy_coins: int) -> tuple[float, float]:
+    """
+    Returns the chances of winning and losing one clash round.
+
+    Ties are re-rolled, so the chances are conditioned on the round not being a tie.
+    """
+    win = lose = 0.0
+    for power, chance in get_power_distribution(skill, coins):
+        for enemy_power, enemy_chance in get_power_distribution(enemy, enemy_coins):
+            if power > enemy_power:
+                win += chance * enemy_chance
+            elif power < enemy_power:
+                lose += chance * enemy_chance
+
+    decided = win + lose
+    if decided == 0:
+        return 0.0, 0.0
+    return win / decided, lose / decided
+
+
+def get_damage_distribution(skill: Skill, coins: int) -> dict[int, float]:
+    """
+    Returns the distribution of total damage dealt by the remaining coins of a skill that won the clash.
+
+    Each coin hits for the power accumulated so far, so the coins are flipped one by one.
+    """
+    heads = skill.heads_chance
+    states = {(0, 0): 1.0}
+    for _ in range(coins):
+        next_states: dict[tuple[int, int], float] = {}
+        for (power_bonus, damage), chance in states.items():
+            for bonus, bonus_chance in ((skill.coin_power, heads), (0, 1 - heads)):
+                hit_bonus = power_bonus + bonus
+                key = (hit_bonus, damage + max(0, skill.power + hit_bonus))
+                next_states[key] = next_states.get(key, 0.0) + chance * bonus_chance
+        states = next_states
+
+    distribution: dict[int, float] = {}
+    for (_, damage), chance in states.items():
+        distribution[damage] = distribution.get(damage, 0.0) + chance
+    return dict(sorted(distribution.items()))
+
+
+@lru_cache(maxsize=1024)
+def simulate_clash(skill: Skill, enemy: Skill) -> ClashResult:
+    """
+    Computes the exact outcome distribution of a clash between two skills.
+
+    Every round the loser loses one coin until one side runs out of coins.
+    The winner then hits with every coin it has left.
+    """
+    states = {(skill.coins, enemy.coins): 1.0}
+    won: dict[int, float] = {}
+    lost: dict[int, float] = {}
+    stalemate = 0.0
+
+    while states:
+        next_states: dict[tuple[int, int], float] = {}
+        for (coins, enemy_coins), chance in states.items():
+            win, lose = get_round_chances(skill, coins, enemy, enemy_coins)
+            if win + lose == 0:
+                stalemate += chance
+                continue
+
+            for outcome, outcome_chance in (((coins, enemy_coins - 1), win), ((coins - 1, enemy_coins), lose)):
+                if outcome_chance == 0:
+                    continue
+                left, enemy_left = outcome
+                if enemy_left == 0:
+                    won[left] = won.get(left, 0.0) + chance * outcome_chance
+                elif left == 0:
+                    lost[enemy_left] = lost.get(enemy_left, 0.0) + chance * outcome_chance
+                else:
+                    next_states[outcome] = next_states.get(outcome, 0.0) + chance * outcome_chance
+        states = next_states
+
+    return ClashResult(
+        win_chance=sum(won.values()),
+        lose_chance=sum(lost.values()),
+        stalemate_chance=stalemate,
+        damage_dealt=combine_damage(skill, won),
+        damage_taken=combine_damage(enemy, lost),
+    )
+
+
+def combine_damage(skill: Skill, coins_left: dict[int, float]) -> dict[int, float]:
+    distribution: dict[int, float] = {}
+    for coins, chance in coins_left.items():
+        for damage, damage_chance in get_damage_distribution(skill, coins).items():
+            distribution[damage] = distribution.get(damage, 0.0) + chance * damage_chance
+    return dict(sorted(distribution.items()))
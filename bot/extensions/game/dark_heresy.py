@@ -1,4 +1,7 @@
 import random
+import re
+from collections import Counter
+from dataclasses import dataclass
 
 from discord import ApplicationContext as AppCtx
 from discord import Embed, SlashCommandGroup, option
@@ -8,6 +11,75 @@ from bot.classes.incarn_bot import IncarnBot
 
 from ._roll_colors import RollResultColors
 
+HORDE_MAX_TESTS = 50
+HORDE_TEST_PATTERN = re.compile(r"^\s*(\d+)\s*(?:([+-])\s*(\d+))?\s*(?:[x×*]\s*(\d+))?\s*$", re.IGNORECASE)
+HISTOGRAM_WIDTH = 20
+
+
+@dataclass
+class DarkHeresyTest:
+    target: int
+    mod: int
+    roll: int
+
+    @property
+    def success(self) -> bool:
+        return self.roll <= self.target + self.mod
+
+    @property
+    def critical(self) -> bool:
+        return self.roll == 1 or self.roll == 100
+
+    @property
+    def degrees(self) -> int:
+        """
+        Degrees of success (positive) or failure (negative) of the test.
+        """
+        difference = abs(self.target + self.mod - self.roll) // 10 + 1
+        return difference if self.success else -difference
+
+    @property
+    def result(self) -> str:
+        result = "Success" if self.success else "Failure"
+        if self.critical:
+            return f"Critical {result.lower()}"
+        return result
+
+
+def parse_horde_tests(tests: str) -> list[tuple[int, int]]:
+    """
+    Parses a comma separated list of tests like `40, 35+10, 30-5x12` into target and modifier pairs.
+
+    :param str tests: The tests to parse. `xN` repeats the test N times.
+    :return: A list of target and modifier pairs, one per test.
+    :raises ValueError: A test cannot be parsed or there are too many tests.
+    """
+    parsed = []
+    for test in tests.split(","):
+        match = HORDE_TEST_PATTERN.match(test)
+        if match is None:
+            message = f"Cannot parse test `{test.strip()}`. Use `target`, `target+mod` or `target+modxcount`."
+            raise ValueError(message)
+
+        target, sign, mod, count = match.groups()
+        repeats = int(count or 1)
+        if repeats < 1:
+            message = f"Test `{test.strip()}` must be repeated at least once."
+            raise ValueError(message)
+
+        if len(parsed) + repeats > HORDE_MAX_TESTS:
+            message = f"Too many tests. The maximum is {HORDE_MAX_TESTS}."
+            raise ValueError(message)
+
+        mod_value = int(mod or 0) * (-1 if sign == "-" else 1)
+        parsed.extend([(int(target), mod_value)] * repeats)
+
+    if not parsed:
+        message = "Provide at least one test."
+        raise ValueError(message)
+
+    return parsed
+
 
 class DarkHeresy(Extension):
     dark_heresy = SlashCommandGroup("dark_heresy", "Commands for dark heresy!")
@@ -16,28 +88,75 @@ class DarkHeresy(Extension):
     @option("target", description="Roll target.")
     @option("mod", description="Roll result modification.", min_value=-60, max_value=60)
     async def dh_roll(self, ctx: AppCtx, target: int, mod: int = 0) -> None:
-        roll = random.randint(1, 100)
-
-        if roll <= target + mod:
-            result = "Success"
-            color = RollResultColors.SUCCESS
+        settings = self.bot.guild_settings.get(ctx.guild_id)
+        test = DarkHeresyTest(target, mod, random.randint(1, 100))
+        if test.success:
+            color = settings.get_color("success", RollResultColors.SUCCESS)
         else:
-            result = "Failure"
-            color = RollResultColors.FAILURE
+            color = settings.get_color("failure", RollResultColors.FAILURE)
 
-        if roll == 1 or roll == 100:
-            result = f"Critical {result.lower()}"
-
-        embed = Embed(title=result, color=color)
-        embed.add_field(name="Roll", value=str(roll))
+        embed = Embed(title=test.result, color=color)
+        embed.add_field(name="Roll", value=str(test.roll))
         embed.add_field(name="Target", value=str(target))
 
         if mod:
             embed.add_field(name="Mod", value=str(mod))
 
-        await ctx.respond(embed=embed)
+        await ctx.respond(embed=embed, ephemeral=settings.hidden)
+
+    def __get_test_string(self, index: int, test: DarkHeresyTest) -> str:
+        target = f"{test.target}{test.mod:+}" if test.mod else str(test.target)
+        mark, degrees = ("✔", "DoS") if test.success else ("✘", "DoF")
+        crit = " crit" if test.critical else ""
+        return f"#{index:<2} {target:>6} → {test.roll:>3} {mark} {abs(test.degrees)} {degrees}{crit}"
+
+    def __get_histogram(self, tests: list[DarkHeresyTest]) -> str:
+        degrees = Counter(test.degrees for test in tests)
+        peak = max(degrees.values())
+        rows = []
+        for degree in sorted(degrees, reverse=True):
+            label = f"{degree:+}"
+            bar = "█" * max(1, round(degrees[degree] / peak * HISTOGRAM_WIDTH))
+            rows.append(f"{label:>4} | {bar} {degrees[degree]}")
+        return "```\n" + "\n".join(rows) + "\n```"
+
+    @dark_heresy.command(name="horde", description="Resolves many tests at once.")
+    @option("tests", description="Comma separated tests: `target`, `target+mod` or `target+modxcount`.")
+    @option("hidden", bool, description="Should the result of the command be hidden from the rest?", default=None)
+    async def dh_horde(self, ctx: AppCtx, tests: str, hidden: bool | None = None) -> None:
+        settings = self.bot.guild_settings.get(ctx.guild_id)
+        try:
+            parsed = parse_horde_tests(tests)
+        except ValueError as error:
+            await ctx.respond(str(error), ephemeral=True)
+            return
+
+        rolls = random.choices(range(1, 101), k=len(parsed))
+        results = [DarkHeresyTest(target, mod, roll) for (target, mod), roll in zip(parsed, rolls)]
+
+        successes = sum(test.success for test in results)
+        failures = len(results) - successes
+        critical_successes = sum(test.critical and test.success for test in results)
+        critical_failures = sum(test.critical and not test.success for test in results)
+
+        embed = Embed(
+            title=f"Horde result: {successes}/{len(results)} succeeded",
+            description="```\n" + "\n".join(
+                self.__get_test_string(index, test) for index, test in enumerate(results, start=1)
+            ) + "\n```",
+            color=(
+                settings.get_color("success", RollResultColors.SUCCESS)
+                if successes >= failures
+                else settings.get_color("failure", RollResultColors.FAILURE)
+            ),
+        )
+        embed.add_field(name="Successes", value=str(successes))
+        embed.add_field(name="Failures", value=str(failures))
+        embed.add_field(name="Criticals", value=f"{critical_successes} successes / {critical_failures} failures")
+        embed.add_field(name="Degrees", value=self.__get_histogram(results), inline=False)
+
+        await ctx.respond(embed=embed, ephemeral=settings.hidden if hidden is None else hidden)
 
 
 def setup(bot: IncarnBot) -> None:
     bot.add_cog(DarkHeresy(bot))
-
@@ -0,0 +1,136 @@
+from logging import getLogger
+
+from discord import ApplicationContext as AppCtx
+from discord import AutocompleteContext, Cog, Embed, OptionChoice, SlashCommandGroup, option
+
+from bot.classes.extension import Extension
+from bot.classes.incarn_bot import IncarnBot
+
+from ._initiative_tracker import Encounter, InitiativeTracker
+from ._roll_colors import RollResultColors
+from .vtm._health_status import MAX_WOUNDS
+
+log = getLogger(__name__)
+
+WOUNDS_OPTIONS = [number for number in range(MAX_WOUNDS + 1)]
+
+
+async def autocomplete_combatant(ctx: AutocompleteContext) -> list[OptionChoice]:
+    tracker: InitiativeTracker = ctx.cog.tracker  # type: ignore
+    encounter = tracker.peek(ctx.interaction.channel_id)  # type: ignore
+    if encounter is None:
+        return []
+    value = (ctx.value or "").casefold()
+    return [
+        OptionChoice(combatant.name) for combatant in encounter.combatants if value in combatant.name.casefold()
+    ]
+
+
+class Initiative(Extension):
+    init = SlashCommandGroup("init", "Turn order and health tracking of an encounter")
+
+    def __init__(self, bot: IncarnBot) -> None:
+        super().__init__(bot)
+        self.tracker = InitiativeTracker()
+        self.bot.shutdown_hooks.append(self.tracker.save)
+
+    @Cog.listener()
+    async def on_ready(self) -> None:
+        self.tracker.start()
+
+    def cog_unload(self) -> None:
+        self.tracker.stop()
+        self.bot.shutdown_hooks.remove(self.tracker.save)
+
+    def __get_embed(self, ctx: AppCtx, encounter: Encounter) -> Embed:
+        settings = self.bot.guild_settings.get(ctx.guild_id)
+        lines = []
+        for index, combatant in enumerate(encounter.combatants):
+            line = f"`{combatant.initiative:>3}` {combatant.name}: {combatant.health_status}"
+            lines.append(f"▶ **{line}**" if index == encounter.turn else line)
+
+        embed = Embed(
+            title=f"Initiative: round {encounter.round}",
+            description="\n".join(lines) or "No combatants yet.",
+            color=settings.get_color("embed", RollResultColors.UNSUCCESSFUL),
+        )
+        if encounter.current is not None:
+            embed.set_footer(text=f"Turn of {encounter.current.name}")
+        return embed
+
+    async def __get_encounter(self, ctx: AppCtx) -> Encounter | None:
+        encounter = await self.tracker.get(ctx.channel_id)
+        if encounter is None or not encounter.combatants:
+            await ctx.respond("There is no encounter in this channel. Start one with `/init add`.", ephemeral=True)
+            return None
+        return encounter
+
+    @init.command(name="add", description="Adds a combatant to the encounter of this channel or updates one.")
+    @option("name", description="Name of the combatant.", max_length=50)
+    @option("initiative", description="Initiative of the combatant.", min_value=-100, max_value=100)
+    @option("wounds", int, description="Wounds the combatant already has.", choices=WOUNDS_OPTIONS, default=0)
+    async def init_add(self, ctx: AppCtx, name: str, initiative: int, wounds: int) -> None:
+        encounter = await self.tracker.get_or_create(ctx.channel_id)
+        try:
+            encounter.add(name.strip(), initiative, wounds)
+        except ValueError as error:
+            await ctx.respond(str(error), ephemeral=True)
+            return
+
+        await ctx.respond(embed=self.__get_embed(ctx, encounter))
+
+    @init.command(name="next", description="Passes the turn to the next combatant.")
+    async def init_next(self, ctx: AppCtx) -> None:
+        encounter = await self.__get_encounter(ctx)
+        if encounter is None:
+            return
+
+        encounter.next()
+        await ctx.respond(embed=self.__get_embed(ctx, encounter))
+
+    @init.command(name="damage", description="Deals wounds to a combatant.")
+    @option("name", description="Name of the combatant.", autocomplete=autocomplete_combatant)
+    @option("amount", description="Amount of wounds.", min_value=1, max_value=MAX_WOUNDS, default=1)
+    async def init_damage(self, ctx: AppCtx, name: str, amount: int) -> None:
+        await self.__change_health(ctx, name, amount)
+
+    @init.command(name="heal", description="Heals wounds of a combatant.")
+    @option("name", description="Name of the combatant.", autocomplete=autocomplete_combatant)
+    @option("amount", description="Amount of wounds.", min_value=1, max_value=MAX_WOUNDS, default=1)
+    async def init_heal(self, ctx: AppCtx, name: str, amount: int) -> None:
+        await self.__change_health(ctx, name, -amount)
+
+    async def __change_health(self, ctx: AppCtx, name: str, amount: int) -> None:
+        encounter = await self.__get_encounter(ctx)
+        if encounter is None:
+            return
+
+        combatant = encounter.find(name)
+        if combatant is None:
+            await ctx.respond(f"There is no combatant named `{name}`.", ephemeral=True)
+            return
+
+        if amount > 0:
+            encounter.damage(combatant, amount)
+        else:
+            encounter.heal(combatant, -amount)
+
+        log.debug("Initiative: '%s' changed wounds of '%s' by %s", ctx.author.name, combatant.name, amount)
+        await ctx.respond(f"**{combatant.name}** is now {combatant.health_status}.")
+
+    @init.command(name="show", description="Shows the turn order of this channel.")
+    async def init_show(self, ctx: AppCtx) -> None:
+        encounter = await self.__get_encounter(ctx)
+        if encounter is None:
+            return
+
+        await ctx.respond(embed=self.__get_embed(ctx, encounter))
+
+    @init.command(name="clear", description="Ends the encounter of this channel.")
+    async def init_clear(self, ctx: AppCtx) -> None:
+        self.tracker.clear(ctx.channel_id)
+        await ctx.respond("The encounter is over.")
+
+
+def setup(bot: IncarnBot) -> None:
+    bot.add_cog(Initiative(bot))
@@ -6,6 +6,8 @@ from discord import Bot, Embed, SlashCommandGroup, option
 
 from bot.classes.extension import Extension
 
+from ._limbus_clash import MAX_SANITY, ClashResult, Skill, simulate_clash
+
 COINS = ["●", "○"]
 
 COLORS = {
@@ -21,6 +23,9 @@ COLORS = {
 COLOR_CHOICES = [color_name for color_name in COLORS.keys()]
 
 
+HISTOGRAM_ROWS = 8
+HISTOGRAM_WIDTH = 20
+
 log = getLogger()
 
 
@@ -32,7 +37,7 @@ class LimbusCompany(Extension):
     @option("power", description="The starting power of the throw. The power of the coin is added to it.")
     @option("coin_power", description="The power of a coin. Will be added to the starting power.")
     @option("color", description="Color for result embed.", choices=COLOR_CHOICES)
-    @option("hidden", description="Should the result of the command be hidden from the rest?")
+    @option("hidden", bool, description="Should the result of the command be hidden from the rest?", default=None)
     async def limbus_roll(
         self,
         ctx: AppCtx,
@@ -40,8 +45,9 @@ class LimbusCompany(Extension):
         power: int = 0,
         coin_power: int = 1,
         color: str = "None",
-        hidden: bool = False
+        hidden: bool | None = None
     ) -> None:
+        settings = self.bot.guild_settings.get(ctx.guild_id)
         coins = []
         additive_power = 0
 
@@ -55,14 +61,85 @@ class LimbusCompany(Extension):
         embed = Embed(
             title="Coinflip result",
             description=" - ".join(coins) + f" | ***{result}***",
-            color=COLORS[color] if color != "None" else Embed.Empty
+            color=COLORS[color] if color != "None" else settings.get_color("embed", Embed.Empty)
         )
         embed.add_field(name="Coins", value=str(amount))
         embed.add_field(name="Power", value=str(power))
         embed.add_field(name="Coin power", value=str(coin_power))
         embed.add_field(name="Result", value=f"{power} + {additive_power} = {result}")
 
-        await ctx.respond(embed=embed, ephemeral=hidden)
+        await ctx.respond(embed=embed, ephemeral=settings.hidden if hidden is None else hidden)
+
+    def __get_skill_string(self, skill: Skill) -> str:
+        return f"{skill.power} + {skill.coins}×{skill.coin_power} ({skill.heads_chance:.0%} heads)"
+
+    def __get_histogram(self, distribution: dict[int, float]) -> str:
+        total = sum(distribution.values())
+        if total == 0:
+            return "No damage."
+
+        lowest, highest = min(distribution), max(distribution)
+        step = max(1, -(-(highest - lowest + 1) // HISTOGRAM_ROWS))
+        buckets = [0.0] * (((highest - lowest) // step) + 1)
+        for damage, chance in distribution.items():
+            buckets[(damage - lowest) // step] += chance / total
+
+        rows = []
+        peak = max(buckets)
+        for index, chance in enumerate(buckets):
+            start = lowest + index * step
+            label = str(start) if step == 1 else f"{start}-{start + step - 1}"
+            bar = "█" * round(chance / peak * HISTOGRAM_WIDTH)
+            rows.append(f"{label:>7} | {bar} {chance:.1%}")
+        return "```\n" + "\n".join(rows) + "\n```"
+
+    @limbus.command(name="clash", description="Calculates the outcome of a clash between two skills.")
+    @option("power", description="Base power of your skill.")
+    @option("coin_power", description="Coin power of your skill.")
+    @option("coins", description="Amount of coins of your skill.", min_value=1, max_value=10)
+    @option("enemy_power", description="Base power of the enemy skill.")
+    @option("enemy_coin_power", description="Coin power of the enemy skill.")
+    @option("enemy_coins", description="Amount of coins of the enemy skill.", min_value=1, max_value=10)
+    @option("sanity", description="Your sanity.", min_value=-MAX_SANITY, max_value=MAX_SANITY)
+    @option("enemy_sanity", description="Enemy sanity.", min_value=-MAX_SANITY, max_value=MAX_SANITY)
+    @option("color", description="Color for result embed.", choices=COLOR_CHOICES)
+    @option("hidden", bool, description="Should the result of the command be hidden from the rest?", default=None)
+    async def limbus_clash(
+        self,
+        ctx: AppCtx,
+        power: int,
+        coin_power: int,
+        coins: int,
+        enemy_power: int,
+        enemy_coin_power: int,
+        enemy_coins: int,
+        sanity: int = 0,
+        enemy_sanity: int = 0,
+        color: str = "None",
+        hidden: bool | None = None
+    ) -> None:
+        settings = self.bot.guild_settings.get(ctx.guild_id)
+        skill = Skill(power, coin_power, coins, sanity)
+        enemy = Skill(enemy_power, enemy_coin_power, enemy_coins, enemy_sanity)
+        result = simulate_clash(skill, enemy)
+
+        embed = Embed(
+            title="Clash result",
+            description=f"Win chance: ***{result.win_chance:.1%}***",
+            color=COLORS[color] if color != "None" else settings.get_color("embed", Embed.Empty)
+        )
+        embed.add_field(name="Your skill", value=self.__get_skill_string(skill))
+        embed.add_field(name="Enemy skill", value=self.__get_skill_string(enemy))
+        embed.add_field(name="Lose chance", value=f"{result.lose_chance:.1%}")
+        if result.stalemate_chance:
+            embed.add_field(name="Stalemate chance", value=f"{result.stalemate_chance:.1%}")
+        embed.add_field(name="Expected damage dealt", value=f"{ClashResult.expected(result.damage_dealt):.1f}")
+        embed.add_field(name="Expected damage taken", value=f"{ClashResult.expected(result.damage_taken):.1f}")
+        embed.add_field(name="Damage dealt on win", value=self.__get_histogram(result.damage_dealt), inline=False)
+
+        log.debug("Limbus clash: '%s' | %s vs %s | %s", ctx.author.name, skill, enemy, result.win_chance)
+
+        await ctx.respond(embed=embed, ephemeral=settings.hidden if hidden is None else hidden)
 
 
 def setup(bot: Bot) -> None:
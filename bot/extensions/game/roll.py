@@ -30,11 +30,17 @@ class Roll(Extension):
     @option("target", description="Success threshold", min_value=0)
     @option("fail", description="Failure threshold", min_value=0)
     async def roll(self, ctx: AppCtx, amount: int, sides: int, target: int = 0, fail: int = 0) -> None:
+        settings = self.bot.guild_settings.get(ctx.guild_id)
+        if amount > settings.dice_cap:
+            await ctx.respond(f"This server allows at most {settings.dice_cap} dices per roll.", ephemeral=True)
+            return
+
         dices = [random.randint(1, sides) for _ in range(amount)]
 
         result_embed = Embed(
             title="Roll result",
-            description=" ".join(str(dice) for dice in dices)
+            description=" ".join(str(dice) for dice in dices),
+            color=settings.get_color("embed", Embed.Empty)
         )
 
         if target:
@@ -45,7 +51,7 @@ class Roll(Extension):
 
         result_embed.add_field(name="Sum", value=str(sum(dices)))
 
-        await ctx.respond(embed=result_embed)
+        await ctx.respond(embed=result_embed, ephemeral=settings.hidden)
 
 
 def setup(bot: IncarnBot) -> None:
@@ -13,3 +13,17 @@ class HealthStatus:
 
     def __str__(self) -> str:
         return f"{self.__name} (penalty: {self.__penalty})"
+
+
+HEALTH_STATUSES = {
+    0: HealthStatus("Healthy", 0),
+    1: HealthStatus("Bruised", 0),
+    2: HealthStatus("Hurt", 1),
+    3: HealthStatus("Injured", 1),
+    4: HealthStatus("Wounded", 2),
+    5: HealthStatus("Mauled", 2),
+    6: HealthStatus("Crippled", 5),
+    7: HealthStatus("Incapacitated", 100),
+}
+
+MAX_WOUNDS = max(HEALTH_STATUSES)
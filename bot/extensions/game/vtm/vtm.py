@@ -7,7 +7,7 @@ from discord import Bot, Embed, SlashCommandGroup, option
 from bot.classes.extension import Extension
 
 from ._colors import VTMColors
-from ._health_status import HealthStatus
+from ._health_status import HEALTH_STATUSES, MAX_WOUNDS
 
 log = getLogger(__name__)
 
@@ -18,18 +18,7 @@ ROLL_RESULT_TEMPLATE = """
 {1}
 """
 
-HEALTH_STATUSES = {
-    0: HealthStatus("Healthy", 0),
-    1: HealthStatus("Bruised", 0),
-    2: HealthStatus("Hurt", 1),
-    3: HealthStatus("Injured", 1),
-    4: HealthStatus("Wounded", 2),
-    5: HealthStatus("Mauled", 2),
-    6: HealthStatus("Crippled", 5),
-    7: HealthStatus("Incapacitated", 100),
-}
-
-WOUNDS_OPTIONS = [number for number in range(8)]
+WOUNDS_OPTIONS = [number for number in range(MAX_WOUNDS + 1)]
 
 
 class VTM(Extension):
@@ -50,9 +39,14 @@ class VTM(Extension):
     @option("wounds", int, description="Amount of character wounds", choices=WOUNDS_OPTIONS, default=0)
     @option("special", description="Is this roll should explode tens?", default=False)
     async def vtm_roll(self, ctx: AppCtx, amount: int, difficulty: int, mod: int, wounds: int, special: bool) -> None:
+        settings = self.bot.guild_settings.get(ctx.guild_id)
+        if amount > settings.dice_cap:
+            await ctx.respond(f"This server allows at most {settings.dice_cap} dices per roll.", ephemeral=True)
+            return
+
         health_status = HEALTH_STATUSES[wounds]
 
-        if wounds == 7:
+        if wounds == MAX_WOUNDS:
             await ctx.respond("Your character has taken too many wounds. Incapacitated.")
             return
 
@@ -77,13 +71,13 @@ class VTM(Extension):
 
         if result > 0:
             embed_title = "Success!"
-            embed_color = VTMColors.GREEN
+            embed_color = settings.get_color("success", VTMColors.GREEN)
         elif result == 0:
             embed_title = "Unsuccessfully!"
-            embed_color = VTMColors.WHITE
+            embed_color = settings.get_color("embed", VTMColors.WHITE)
         else:
             embed_title = "Failure!"
-            embed_color = VTMColors.RED
+            embed_color = settings.get_color("failure", VTMColors.RED)
         embed_description = self.__get_roll_result_string(rolls)
 
         embed = Embed(title=embed_title, description=embed_description, color=embed_color)
@@ -106,7 +100,7 @@ class VTM(Extension):
             result,
         )
 
-        await ctx.respond(embed=embed)
+        await ctx.respond(embed=embed, ephemeral=settings.hidden)
 
     @vtm.command(name="soak", description="Calculates the amount of absorbed damage.")
     @option("damage", description="How much damage should the character be dealt?", min_value=1)
@@ -115,6 +109,7 @@ class VTM(Extension):
     @option("mod", description="What will be the modifier?", default=0)
     @option("guaranteed", description="Guaranteed amount of damage absorbed.", default=0)
     async def vtm_soak(self, ctx: AppCtx, damage: int, stamina: int, armor: int, mod: int, guaranteed: int) -> None:
+        settings = self.bot.guild_settings.get(ctx.guild_id)
         rolls = [random.randint(1, 10) for _ in range(stamina + armor + mod)]
 
         difficult = 6
@@ -127,10 +122,10 @@ class VTM(Extension):
 
         if final_damage > 0:
             embed_title = f"{final_damage} damage done!"
-            embed_color = VTMColors.RED
+            embed_color = settings.get_color("failure", VTMColors.RED)
         else:
             embed_title = "All damage absorbed!"
-            embed_color = VTMColors.GREEN
+            embed_color = settings.get_color("success", VTMColors.GREEN)
         embed_description = self.__get_roll_result_string(rolls)
 
         embed = Embed(title=embed_title, description=embed_description, color=embed_color)
@@ -141,7 +136,7 @@ class VTM(Extension):
         embed.add_field(name="Absorbed", value=str(absorbed_damage))
         embed.add_field(name="Guaranteed", value=str(guaranteed))
         embed.add_field(name="Final damage", value=str(final_damage))
-        await ctx.respond(embed=embed)
+        await ctx.respond(embed=embed, ephemeral=settings.hidden)
 
 
 def setup(bot: Bot) -> None:
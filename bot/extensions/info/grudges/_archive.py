@@ -0,0 +1,75 @@
+import asyncio
+from datetime import timedelta
+from logging import getLogger
+
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+
+from bot.models import ArchivedGrudgeModel, GrudgeModel
+
+log = getLogger(__name__)
+
+ARCHIVED_FIELDS = ("grudge_id", "user_id", "title", "content", "created_at", "revenged", "revenged_at")
+
+
+class GrudgeArchiver:
+    """
+    Moves grudges revenged more than `age` ago from the grudge table into the archive table.
+
+    Grudges are moved in small batches, each in its own transaction, so the hot table is never locked for long.
+    Aggregates in the stats table already include the moved grudges and are not touched.
+    """
+
+    def __init__(self, age: timedelta, batch_size: int = 500, interval: timedelta = timedelta(hours=1)) -> None:
+        self.__age = age
+        self.__batch_size = batch_size
+        self.__interval = interval
+        self.__task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__run(), name="grudge-archive")
+
+    def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    async def archive(self) -> int:
+        """
+        Moves every grudge that is old enough.
+
+        :return: Amount of moved grudges.
+        """
+        revenged_before = timezone.now() - self.__age
+        moved = 0
+        while True:
+            grudge_ids = await GrudgeModel.filter(revenged=True, revenged_at__lt=revenged_before).order_by(
+                "grudge_id"
+            ).limit(self.__batch_size).values_list("grudge_id", flat=True)
+            if not grudge_ids:
+                break
+
+            async with in_transaction():
+                # Read again under a lock, a grudge may have been deleted since it was selected.
+                batch = await GrudgeModel.filter(grudge_id__in=grudge_ids).select_for_update().values(*ARCHIVED_FIELDS)
+                await ArchivedGrudgeModel.bulk_create([ArchivedGrudgeModel(**grudge) for grudge in batch])
+                await GrudgeModel.filter(grudge_id__in=[grudge["grudge_id"] for grudge in batch]).delete()
+
+            moved += len(batch)
+            if len(grudge_ids) < self.__batch_size:
+                break
+            await asyncio.sleep(0)
+
+        return moved
+
+    async def __run(self) -> None:
+        while True:
+            try:
+                moved = await self.archive()
+                log.debug("Grudges: archived %s grudges", moved)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("Grudge archiving failed, retrying with the next run")
+            await asyncio.sleep(self.__interval.total_seconds())
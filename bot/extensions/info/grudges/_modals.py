@@ -1,12 +1,17 @@
 from discord import InputTextStyle, ui
 from discord.interactions import Interaction
+from tortoise.transactions import in_transaction
 
 from bot.models import GrudgeModel, UserModel
+from bot.utils.read_router import ReadRouter
+
+from ._stats import ensure_stats, record_grudge_added
 
 
 class AddGrudgeModal(ui.Modal):
-    def __init__(self) -> None:
+    def __init__(self, read_router: ReadRouter) -> None:
         super().__init__(title="Add new grudge")
+        self.__read_router = read_router
         self.add_item(ui.InputText(label="Title", max_length=100, required=True))
         self.add_item(ui.InputText(label="Content", style=InputTextStyle.long, max_length=300, required=True))
 
@@ -17,16 +22,21 @@ class AddGrudgeModal(ui.Modal):
         )
         title = self.children[0].value
         content = self.children[1].value
-        await GrudgeModel.create(title=title, content=content, user=user)
+        await ensure_stats(user.user_id)
+        async with in_transaction():
+            await GrudgeModel.create(title=title, content=content, user=user)
+            await record_grudge_added(user.user_id)
+        self.__read_router.mark_written(user.user_id)
         await interaction.response.send_message("Done! New grudge added.", ephemeral=True)
 
 
 class EditGrudgeModal(ui.Modal):
     __editable_grudge: GrudgeModel
 
-    def __init__(self, grudge: GrudgeModel) -> None:
+    def __init__(self, grudge: GrudgeModel, read_router: ReadRouter) -> None:
         super().__init__(title="Edit grudge")
         self.__editable_grudge = grudge
+        self.__read_router = read_router
         self.add_item(
             ui.InputText(
                 label="Title",
@@ -54,4 +64,5 @@ class EditGrudgeModal(ui.Modal):
         self.__editable_grudge.title = new_title
         self.__editable_grudge.content = new_content
         await self.__editable_grudge.save()
+        self.__read_router.mark_written(self.__editable_grudge.user_id)  # type: ignore
         await interaction.response.send_message("Done! Grudge edited.")
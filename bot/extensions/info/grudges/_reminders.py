@@ -0,0 +1,137 @@
+import asyncio
+import heapq
+import re
+from datetime import datetime, timedelta
+from logging import getLogger
+from typing import Awaitable, Callable
+
+from tortoise import timezone
+
+from bot.models import ReminderModel
+
+log = getLogger(__name__)
+
+DURATION_PATTERN = re.compile(r"(\d+)\s*(w|d|h|m)", re.IGNORECASE)
+DURATION_UNITS = {"w": "weeks", "d": "days", "h": "hours", "m": "minutes"}
+MAX_DURATION = timedelta(days=365)
+
+
+def parse_duration(value: str) -> timedelta:
+    """
+    Parses durations like `2w`, `1d12h` or `90m`.
+
+    :raises ValueError: The duration cannot be parsed or is out of range.
+    """
+    compact = value.replace(" ", "")
+    matches = DURATION_PATTERN.findall(compact)
+    if not matches or "".join(amount + unit for amount, unit in matches).lower() != compact.lower():
+        message = f"Cannot parse duration `{value}`. Use something like `2w`, `1d12h` or `90m`."
+        raise ValueError(message)
+
+    duration = timedelta()
+    for amount, unit in matches:
+        duration += timedelta(**{DURATION_UNITS[unit.lower()]: int(amount)})
+
+    if not timedelta(minutes=1) <= duration <= MAX_DURATION:
+        message = f"Duration must be between 1 minute and {MAX_DURATION.days} days."
+        raise ValueError(message)
+
+    return duration
+
+
+class ReminderScheduler:
+    """
+    Fires stored reminders from one task.
+
+    Only reminders due within the next `window` are kept in a min-heap; the rest stay in the database
+    until the window moves forward. A reminder's row is deleted only after it was delivered, so a crash
+    or a failed delivery leaves it to be picked up again by the next window load. Reminders already in
+    the heap are never scheduled twice.
+    """
+
+    def __init__(
+        self,
+        on_due: Callable[[ReminderModel], Awaitable[None]],
+        window: timedelta = timedelta(hours=1),
+        batch_size: int = 1000,
+    ) -> None:
+        self.__on_due = on_due
+        self.__window = window
+        self.__batch_size = batch_size
+        self.__heap: list[tuple[datetime, int]] = []
+        self.__scheduled: set[int] = set()
+        self.__loaded_until = datetime.min.replace(tzinfo=timezone.get_default_timezone())
+        self.__wake = asyncio.Event()
+        self.__task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self.__heap)
+
+    def start(self) -> None:
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__run(), name="grudge-reminders")
+
+    def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    def schedule(self, reminder_id: int, remind_at: datetime) -> None:
+        if remind_at > self.__loaded_until or reminder_id in self.__scheduled:
+            return
+        heapq.heappush(self.__heap, (remind_at, reminder_id))
+        self.__scheduled.add(reminder_id)
+        self.__wake.set()
+
+    async def __load(self, now: datetime) -> None:
+        until = now + self.__window
+        reminders = await ReminderModel.filter(remind_at__lte=until).order_by("remind_at").limit(
+            self.__batch_size
+        ).values_list("reminder_id", "remind_at")
+
+        if len(reminders) == self.__batch_size:
+            until = reminders[-1][1]
+
+        self.__loaded_until = until
+        for reminder_id, remind_at in reminders:
+            self.schedule(reminder_id, remind_at)
+
+        log.debug("Reminders: loaded %s due until %s", len(reminders), until)
+
+    async def __fire(self, reminder_id: int) -> None:
+        reminder = await ReminderModel.get_or_none(reminder_id=reminder_id).prefetch_related("grudge")
+        if reminder is None:
+            return
+
+        try:
+            await self.__on_due(reminder)
+        except Exception:
+            log.exception("Reminder %s failed, it will be retried with the next window", reminder_id)
+            return
+
+        await ReminderModel.filter(reminder_id=reminder_id).delete()
+
+    async def __run(self) -> None:
+        while True:
+            try:
+                now = timezone.now()
+                if now >= self.__loaded_until:
+                    await self.__load(now)
+
+                while self.__heap and self.__heap[0][0] <= now:
+                    _, reminder_id = heapq.heappop(self.__heap)
+                    self.__scheduled.discard(reminder_id)
+                    await self.__fire(reminder_id)
+
+                next_wake = min(self.__heap[0][0], self.__loaded_until) if self.__heap else self.__loaded_until
+                self.__wake.clear()
+                try:
+                    await asyncio.wait_for(self.__wake.wait(), max(0.0, (next_wake - timezone.now()).total_seconds()))
+                except TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("Reminder scheduler failed, retrying in a minute")
+                await asyncio.sleep(60)
@@ -0,0 +1,140 @@
+from datetime import datetime
+
+from discord import Guild
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F, Q
+from tortoise.queryset import QuerySet
+
+from bot.models import ArchivedGrudgeModel, GrudgeModel, GrudgeStatsModel, UserModel
+from bot.utils.read_router import ReadRouter
+
+LEADERBOARD_PAGE_SIZE = 100
+LEADERBOARD_MAX_PAGES = 20
+
+
+def format_duration(seconds: float) -> str:
+    minutes, _ = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    parts = [f"{value}{unit}" for value, unit in ((days, "d"), (hours, "h"), (minutes, "m")) if value]
+    return " ".join(parts) or "<1m"
+
+
+def get_revenge_seconds(grudge: GrudgeModel | ArchivedGrudgeModel) -> int:
+    if grudge.revenged_at is None:
+        return 0
+    return max(0, int((grudge.revenged_at - grudge.created_at).total_seconds()))
+
+
+async def ensure_stats(user_id: int) -> None:
+    """
+    Creates the aggregate row of the user, filling it from existing and archived grudges once.
+
+    Must be called before the write that is going to be recorded, otherwise the write is counted twice.
+    """
+    if await GrudgeStatsModel.exists(user_id=user_id):
+        return
+
+    grudges = [
+        *await GrudgeModel.filter(user_id=user_id).only("created_at", "revenged", "revenged_at"),
+        *await ArchivedGrudgeModel.filter(user_id=user_id).only("created_at", "revenged", "revenged_at"),
+    ]
+    revenged = [grudge for grudge in grudges if grudge.revenged]
+    revenge_seconds = sum(get_revenge_seconds(grudge) for grudge in revenged)
+    try:
+        await GrudgeStatsModel.create(
+            user_id=user_id,
+            total=len(grudges),
+            revenged=len(revenged),
+            revenge_seconds=revenge_seconds,
+            average_revenge_seconds=revenge_seconds // len(revenged) if revenged else 0,
+        )
+    except IntegrityError:
+        pass
+
+
+async def backfill_stats() -> int:
+    """
+    Creates aggregate rows for every user that does not have one yet.
+
+    :return: Amount of created rows.
+    """
+    existing = set(await GrudgeStatsModel.all().values_list("user_id", flat=True))
+    user_ids = await UserModel.all().values_list("user_id", flat=True)
+    missing = [user_id for user_id in user_ids if user_id not in existing]
+    for user_id in missing:
+        await ensure_stats(user_id)
+    return len(missing)
+
+
+async def get_guild_top(
+    read_router: ReadRouter, guild: Guild, query: QuerySet[GrudgeStatsModel], order: str, size: int
+) -> tuple[list[GrudgeStatsModel], bool]:
+    """
+    Collects the first rows of the query, ordered by `order` and then by user, that belong to members of the guild.
+
+    Pages continue after the last row of the previous one instead of using an offset, so every page is an index
+    range scan. At most `LEADERBOARD_MAX_PAGES` pages are read; when the guild members are rare in the table,
+    the result only covers the rows that were read.
+
+    :param read_router: Router that executes the read-only query.
+    :param guild: Guild which members should be kept.
+    :param query: Filtered query.
+    :param order: Field to order by, prefixed with `-` for the descending order.
+    :param size: Maximum amount of returned rows.
+    :return: Rows of the guild members and whether the scan stopped before the end of the table.
+    """
+    field = order.removeprefix("-")
+    comparison = "lt" if order.startswith("-") else "gt"
+    query = query.order_by(order, "user_id").limit(LEADERBOARD_PAGE_SIZE)
+
+    top: list[GrudgeStatsModel] = []
+    after: Q | None = None
+    for _ in range(LEADERBOARD_MAX_PAGES):
+        page = await read_router.read(query if after is None else query.filter(after))
+        top.extend(stats for stats in page if guild.get_member(stats.user_id) is not None)
+        if len(top) >= size or len(page) < LEADERBOARD_PAGE_SIZE:
+            return top[:size], False
+
+        last = page[-1]
+        value = getattr(last, field)
+        after = Q(**{f"{field}__{comparison}": value}) | Q(**{field: value, "user_id__gt": last.user_id})
+    return top, True
+
+
+async def update_average(user_id: int) -> None:
+    stats = GrudgeStatsModel.filter(user_id=user_id)
+    await stats.filter(revenged=0).update(average_revenge_seconds=0)
+    await stats.filter(revenged__gt=0).update(average_revenge_seconds=F("revenge_seconds") / F("revenged"))
+
+
+async def record_grudge_added(user_id: int) -> None:
+    await GrudgeStatsModel.filter(user_id=user_id).update(total=F("total") + 1)
+
+
+async def record_grudge_deleted(grudge: GrudgeModel | ArchivedGrudgeModel) -> None:
+    if grudge.revenged:
+        await GrudgeStatsModel.filter(user_id=grudge.user_id).update(  # type: ignore
+            total=F("total") - 1,
+            revenged=F("revenged") - 1,
+            revenge_seconds=F("revenge_seconds") - get_revenge_seconds(grudge),
+        )
+        await update_average(grudge.user_id)  # type: ignore
+        return
+    await GrudgeStatsModel.filter(user_id=grudge.user_id).update(total=F("total") - 1)  # type: ignore
+
+
+async def record_grudge_revenged(grudge: GrudgeModel, previous_revenged_at: datetime | None) -> None:
+    seconds = get_revenge_seconds(grudge)
+    if previous_revenged_at is None:
+        await GrudgeStatsModel.filter(user_id=grudge.user_id).update(  # type: ignore
+            revenged=F("revenged") + 1, revenge_seconds=F("revenge_seconds") + seconds
+        )
+        await update_average(grudge.user_id)  # type: ignore
+        return
+
+    previous_seconds = max(0, int((previous_revenged_at - grudge.created_at).total_seconds()))
+    await GrudgeStatsModel.filter(user_id=grudge.user_id).update(  # type: ignore
+        revenge_seconds=F("revenge_seconds") + seconds - previous_seconds
+    )
+    await update_average(grudge.user_id)  # type: ignore
@@ -1,26 +1,112 @@
-from datetime import datetime
+from datetime import timedelta
+from logging import getLogger
 
 from discord import ApplicationContext as AppCtx
-from discord import Bot, ButtonStyle, Embed, SlashCommandGroup, option
+from discord import (
+    AutocompleteContext,
+    ButtonStyle,
+    Cog,
+    Embed,
+    HTTPException,
+    OptionChoice,
+    SlashCommandGroup,
+    User,
+    option,
+)
 from discord.ext.pages import Page, Paginator, PaginatorButton
+from tortoise import timezone
+from tortoise.transactions import in_transaction
 
 from bot.classes.extension import Extension
-from bot.models import GrudgeModel, UserModel
+from bot.classes.incarn_bot import IncarnBot
+from bot.config import ARCHIVE_CONFIG
+from bot.models import ArchivedGrudgeModel, GrudgeModel, GrudgeStatsModel, ReminderModel
 
+from ._archive import GrudgeArchiver
 from ._modals import AddGrudgeModal, EditGrudgeModal
+from ._reminders import ReminderScheduler, parse_duration
+from ._stats import (
+    backfill_stats,
+    ensure_stats,
+    format_duration,
+    get_guild_top,
+    record_grudge_deleted,
+    record_grudge_revenged,
+)
+
+LEADERBOARD_SIZE = 10
+PAGINATOR_KEY = "grudges"
+MAX_AUTOCOMPLETE_RESULTS = 25
+
+log = getLogger(__name__)
+
+
+async def autocomplete_grudge_id(ctx: AutocompleteContext) -> list[OptionChoice]:
+    user_id = ctx.interaction.user.id  # type: ignore
+    query = GrudgeModel.filter(user_id=user_id).only("grudge_id", "title").order_by("-grudge_id")
+    grudges = await ctx.bot.read_router.read(query, user_id)  # type: ignore
+    prefix = str(ctx.value or "")
+    return [
+        OptionChoice(f"{grudge.grudge_id}: {grudge.title}"[:100], grudge.grudge_id)
+        for grudge in grudges
+        if str(grudge.grudge_id).startswith(prefix)
+    ][:MAX_AUTOCOMPLETE_RESULTS]
 
 
 class Grudges(Extension):
     grudge = SlashCommandGroup("grudge", "The Great Book of Grudges")
 
+    def __init__(self, bot: IncarnBot) -> None:
+        super().__init__(bot)
+        self.reminders = ReminderScheduler(self.__send_reminder)
+        self.archiver = GrudgeArchiver(timedelta(days=ARCHIVE_CONFIG.after_days), ARCHIVE_CONFIG.batch_size)
+        self.__stats_backfilled = False
+        self.bot.paginators.add_rebuilder(PAGINATOR_KEY, self.__rebuild_paginator)
+
+    @Cog.listener()
+    async def on_ready(self) -> None:
+        self.reminders.start()
+        if ARCHIVE_CONFIG.enabled:
+            self.archiver.start()
+
+        if not self.__stats_backfilled:
+            self.__stats_backfilled = True
+            created = await backfill_stats()
+            log.debug("Grudges: created %s missing stats rows", created)
+
+    def cog_unload(self) -> None:
+        self.reminders.stop()
+        self.archiver.stop()
+        self.bot.paginators.remove_rebuilder(PAGINATOR_KEY)
+
+    async def __send_reminder(self, reminder: ReminderModel) -> None:
+        grudge = reminder.grudge
+        if grudge.revenged:
+            return
+
+        embed = Embed(title=f"Still unrevenged: {grudge.title}", description=grudge.content)
+        embed.add_field(name="Created at", value=f"<t:{int(grudge.created_at.timestamp())}:f>")
+        embed.set_footer(text=f"ID: {grudge.grudge_id}")
+
+        user = await self.bot.get_or_fetch_user(reminder.user_id)  # type: ignore
+        if user is None:
+            return
+
+        try:
+            await user.send(embed=embed)
+        except HTTPException as error:
+            log.warning("Grudges: cannot send reminder %s to '%s': %s", reminder.reminder_id, user.name, error)
+
     @grudge.command(name="add", description="Adds new grudge.")
     async def add_grudge(self, ctx: AppCtx) -> None:
-        await ctx.send_modal(AddGrudgeModal())
+        await ctx.send_modal(AddGrudgeModal(self.bot.read_router))
 
     @grudge.command(name="delete", description="Deletes grudge.")
-    @option(name="grudge_id", description="Grudge's id.")
+    @option(name="grudge_id", description="Grudge's id.", autocomplete=autocomplete_grudge_id)
     async def delete_grudge(self, ctx: AppCtx, grudge_id: int) -> None:
         grudge = await GrudgeModel.get_or_none(grudge_id=grudge_id)
+        if grudge is None:
+            grudge = await ArchivedGrudgeModel.get_or_none(grudge_id=grudge_id)
 
         if grudge is None:
             await ctx.respond("Grudge with provided id is not exists.", ephemeral=True)
@@ -30,12 +116,16 @@ class Grudges(Extension):
             await ctx.respond("You can't delete this grudge.", ephemeral=True)
             return
 
-        await grudge.delete()
+        await ensure_stats(ctx.author.id)
+        async with in_transaction():
+            await grudge.delete()
+            await record_grudge_deleted(grudge)
+        self.bot.read_router.mark_written(ctx.author.id)
 
         await ctx.respond("Done!", ephemeral=True)
 
     @grudge.command(name="edit", description="Edits grudge.")
-    @option(name="grudge_id", description="Grudge's id.")
+    @option(name="grudge_id", description="Grudge's id.", autocomplete=autocomplete_grudge_id)
     async def edit_grudge(self, ctx: AppCtx, grudge_id: int) -> None:
         grudge = await GrudgeModel.get_or_none(grudge_id=grudge_id)
 
@@ -47,15 +137,15 @@ class Grudges(Extension):
             await ctx.respond("You can't edit this grudge.", ephemeral=True)
             return
 
-        modal = EditGrudgeModal(grudge)
+        modal = EditGrudgeModal(grudge, self.bot.read_router)
         await ctx.send_modal(modal)
 
-    def __get_raw_pages(self, grudges: list[GrudgeModel]):
+    def __get_raw_pages(self, grudges: list[GrudgeModel | ArchivedGrudgeModel]):
         grudge_per_page: int = 3
         for index in range(0, len(grudges), grudge_per_page):
             yield grudges[index:index + grudge_per_page]
 
-    def __get_page(self, raw_page: list[GrudgeModel]) -> Page:
+    def __get_page(self, raw_page: list[GrudgeModel | ArchivedGrudgeModel]) -> Page:
         embeds = []
         for grudge in raw_page:
             embed = Embed(title=grudge.title, description=grudge.content)
@@ -70,23 +160,55 @@ class Grudges(Extension):
 
         return Page(embeds=embeds)
 
-    def __get_pages(self, grudges: list[GrudgeModel]) -> list[Page]:
+    def __get_pages(self, grudges: list[GrudgeModel | ArchivedGrudgeModel]) -> list[Page]:
         pages = []
         raw_pages = self.__get_raw_pages(grudges)
         for raw_page in raw_pages:
             pages.append(self.__get_page(raw_page))
         return pages
 
+    async def __get_grudges(self, user_id: int, include_archived: bool) -> list[GrudgeModel | ArchivedGrudgeModel]:
+        read = self.bot.read_router.read
+        grudges = await read(GrudgeModel.filter(user_id=user_id).order_by("grudge_id"), user_id)
+        if include_archived:
+            archived = await read(ArchivedGrudgeModel.filter(user_id=user_id), user_id)
+            grudges = sorted([*archived, *grudges], key=lambda grudge: grudge.grudge_id)
+        return grudges
+
+    def __create_paginator(
+        self, user_id: int, include_archived: bool, grudges: list[GrudgeModel | ArchivedGrudgeModel]
+    ) -> Paginator:
+        buttons = [
+            PaginatorButton("first", "<<", style=ButtonStyle.gray),
+            PaginatorButton("prev", "<", style=ButtonStyle.green),
+            PaginatorButton("page_indicator", style=ButtonStyle.gray, disabled=True),
+            PaginatorButton("next", ">", style=ButtonStyle.green),
+            PaginatorButton("last", ">>", style=ButtonStyle.gray)
+        ]
+        return self.bot.paginators.create(
+            PAGINATOR_KEY,
+            user_id,
+            include_archived,
+            self.__get_pages(grudges),
+            show_indicator=True,
+            use_default_buttons=False,
+            custom_buttons=buttons
+        )
+
+    async def __rebuild_paginator(self, user_id: int, include_archived: bool) -> Paginator | None:
+        grudges = await self.__get_grudges(user_id, include_archived)
+        if not grudges:
+            return None
+        return self.__create_paginator(user_id, include_archived, grudges)
+
     @grudge.command(name="list", description="Lists your grudges")
     @option("compact", description="Should you view grudges in compact mode?")
     @option("hidden", description="Should you view grudges in private view?")
-    async def list_grudges(self, ctx: AppCtx, compact: bool = True, hidden: bool = True) -> None:
-        user, _ = await UserModel.get_or_create(
-            user_id=ctx.author.id,
-            defaults={"username": ctx.author.name},
-        )
-
-        grudges = await user.grudges.all()
+    @option("include_archived", description="Should old revenged grudges from the archive be listed too?")
+    async def list_grudges(
+        self, ctx: AppCtx, compact: bool = True, hidden: bool = True, include_archived: bool = False
+    ) -> None:
+        grudges = await self.__get_grudges(ctx.author.id, include_archived)
 
         if len(grudges) < 1:
             await ctx.respond("No grudges!")
@@ -104,23 +226,11 @@ class Grudges(Extension):
             await ctx.respond(embed=embed, ephemeral=hidden)
             return
 
-        buttons = [
-            PaginatorButton("first", "<<", style=ButtonStyle.gray),
-            PaginatorButton("prev", "<", style=ButtonStyle.green),
-            PaginatorButton("page_indicator", style=ButtonStyle.gray, disabled=True),
-            PaginatorButton("next", ">", style=ButtonStyle.green),
-            PaginatorButton("last", ">>", style=ButtonStyle.gray)
-        ]
-        paginator = Paginator(
-            self.__get_pages(grudges),
-            show_indicator=True,
-            use_default_buttons=False,
-            custom_buttons=buttons
-        )
+        paginator = self.__create_paginator(ctx.author.id, include_archived, grudges)
         await paginator.respond(ctx.interaction)
 
     @grudge.command(name="mark_as_revenged", description="Marks grudge as revenged or unrevenged.")
-    @option(name="grudge_id", description="Grudge's id.")
+    @option(name="grudge_id", description="Grudge's id.", autocomplete=autocomplete_grudge_id)
     async def mark_grudge_as(self, ctx: AppCtx, grudge_id: int) -> None:
         grudge = await GrudgeModel.get_or_none(grudge_id=grudge_id)
 
@@ -132,12 +242,104 @@ class Grudges(Extension):
             await ctx.respond("You can't mark this grudge as revenged.", ephemeral=True)
             return
 
+        previous_revenged_at = grudge.revenged_at if grudge.revenged else None
         grudge.revenged = True
-        grudge.revenged_at = datetime.now()
-        await grudge.save()
+        grudge.revenged_at = timezone.now()
+
+        await ensure_stats(ctx.author.id)
+        async with in_transaction():
+            await grudge.save()
+            await record_grudge_revenged(grudge, previous_revenged_at)
+        self.bot.read_router.mark_written(ctx.author.id)
 
         await ctx.respond("Done!", ephemeral=True)
 
+    @grudge.command(name="stats", description="Shows grudge statistics.")
+    @option("user", User, description="Whose statistics to show. Defaults to you.", default=None)
+    @option("hidden", description="Should you view statistics in private view?")
+    async def grudge_stats(self, ctx: AppCtx, user: User | None = None, hidden: bool = True) -> None:
+        target = user or ctx.author
+        stats = await self.bot.read_router.read(GrudgeStatsModel.get_or_none(user_id=target.id), target.id)
+        if stats is None:
+            await ensure_stats(target.id)
+            stats = await GrudgeStatsModel.get(user_id=target.id)
+
+        embed = Embed(title=f"Grudges of {target.name}")
+        embed.add_field(name="Total", value=str(stats.total))
+        embed.add_field(name="Revenged", value=str(stats.revenged))
+        embed.add_field(name="Open", value=str(stats.total - stats.revenged))
+        embed.add_field(
+            name="Average time to revenge",
+            value=format_duration(stats.average_revenge_seconds) if stats.revenged else "-",
+        )
+        await ctx.respond(embed=embed, ephemeral=hidden)
+
+    @grudge.command(name="leaderboard", description="Shows the most grudging and the fastest avengers of the server.")
+    @option("hidden", description="Should you view the leaderboard in private view?")
+    async def grudge_leaderboard(self, ctx: AppCtx, hidden: bool = False) -> None:
+        if ctx.guild is None:
+            await ctx.respond("The leaderboard is only available on servers.", ephemeral=True)
+            return
+
+        most_grudges, most_grudges_partial = await get_guild_top(
+            self.bot.read_router, ctx.guild, GrudgeStatsModel.filter(total__gt=0), "-total", LEADERBOARD_SIZE
+        )
+        fastest, fastest_partial = await get_guild_top(
+            self.bot.read_router,
+            ctx.guild,
+            GrudgeStatsModel.filter(revenged__gt=0),
+            "average_revenge_seconds",
+            LEADERBOARD_SIZE,
+        )
+
+        embed = Embed(title=f"Grudge leaderboard of {ctx.guild.name}")
+        embed.add_field(
+            name="Most grudges",
+            value="\n".join(
+                f"{place}. <@{stats.user_id}>: {stats.total}" for place, stats in enumerate(most_grudges, start=1)
+            ) or ("No members in the searched top." if most_grudges_partial else "No grudges yet."),
+        )
+        embed.add_field(
+            name="Fastest avengers",
+            value="\n".join(
+                f"{place}. <@{stats.user_id}>: {format_duration(stats.average_revenge_seconds)}"
+                for place, stats in enumerate(fastest, start=1)
+            ) or ("No members in the searched top." if fastest_partial else "Nobody has taken revenge yet."),
+        )
+        if most_grudges_partial or fastest_partial:
+            embed.set_footer(text="Partial: only the top of all users was searched for members of this server.")
+        await ctx.respond(embed=embed, ephemeral=hidden)
+
+    @grudge.command(name="remind", description="Reminds you about an unrevenged grudge.")
+    @option(name="grudge_id", description="Grudge's id.", autocomplete=autocomplete_grudge_id)
+    @option(name="in", parameter_name="delay", description="When to remind, e.g. 2w, 1d12h or 90m.")
+    async def remind_grudge(self, ctx: AppCtx, grudge_id: int, delay: str) -> None:
+        try:
+            duration = parse_duration(delay)
+        except ValueError as error:
+            await ctx.respond(str(error), ephemeral=True)
+            return
+
+        grudge = await GrudgeModel.get_or_none(grudge_id=grudge_id)
+
+        if grudge is None:
+            await ctx.respond("Grudge with provided id is not exists.", ephemeral=True)
+            return
+
+        if ctx.author.id != grudge.user_id:  # type: ignore
+            await ctx.respond("You can't set reminders for this grudge.", ephemeral=True)
+            return
+
+        if grudge.revenged:
+            await ctx.respond("This grudge is already revenged.", ephemeral=True)
+            return
+
+        remind_at = timezone.now() + duration
+        reminder = await ReminderModel.create(grudge=grudge, user_id=ctx.author.id, remind_at=remind_at)
+        self.reminders.schedule(reminder.reminder_id, remind_at)
+
+        await ctx.respond(f"Done! I will remind you <t:{int(remind_at.timestamp())}:R>.", ephemeral=True)
+
 
-def setup(bot: Bot) -> None:
+def setup(bot: IncarnBot) -> None:
     bot.add_cog(Grudges(bot))
@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class Dimension(StrEnum):
+    TEMPERATURE = "temperature"
+    LENGTH = "length"
+    MASS = "mass"
+    VOLUME = "volume"
+    SPEED = "speed"
+    DATA_SIZE = "data size"
+
+
+@dataclass(frozen=True)
+class Unit:
+    """
+    A unit of measurement defined as an affine map to the base unit of its dimension.
+
+    A value `x` in this unit equals `x * scale + offset` in the base unit.
+    """
+    name: str
+    symbol: str
+    dimension: Dimension
+    scale: float
+    offset: float = 0.0
+
+    @property
+    def display_name(self) -> str:
+        return f"{self.name.capitalize()} ({self.symbol})"
+
+
+class UnitRegistry:
+    def __init__(self) -> None:
+        self.__units: dict[str, Unit] = {}
+        self.__aliases: dict[str, Unit] = {}
+        self.__transforms: dict[tuple[Unit, Unit], tuple[float, float]] = {}
+
+    @property
+    def units(self) -> list[Unit]:
+        return list(self.__units.values())
+
+    def register(self, unit: Unit) -> None:
+        self.__units[unit.name] = unit
+        self.__aliases[unit.name.lower()] = unit
+        self.__aliases[unit.symbol.lower()] = unit
+        self.__aliases[unit.symbol.lstrip("°").lower()] = unit
+        self.__transforms.clear()
+
+    def get(self, name: str) -> Unit:
+        """
+        Returns the unit registered under the name or symbol.
+
+        :param str name: Name or symbol of the unit. Case-insensitive.
+        :raises ValueError: There is no such unit.
+        """
+        unit = self.__aliases.get(name.strip().lower())
+        if unit is None:
+            message = f"Unknown unit `{name}`."
+            raise ValueError(message)
+        return unit
+
+    def get_transform(self, from_unit: Unit, to_unit: Unit) -> tuple[float, float]:
+        """
+        Returns the composed affine transform between two units of the same dimension.
+
+        :return: `scale` and `offset` so that `value * scale + offset` converts a value.
+        :raises ValueError: Units belong to different dimensions.
+        """
+        transform = self.__transforms.get((from_unit, to_unit))
+        if transform is not None:
+            return transform
+
+        if from_unit.dimension != to_unit.dimension:
+            message = f"Cannot convert {from_unit.dimension} to {to_unit.dimension}."
+            raise ValueError(message)
+
+        transform = (from_unit.scale / to_unit.scale, (from_unit.offset - to_unit.offset) / to_unit.scale)
+        self.__transforms[(from_unit, to_unit)] = transform
+        return transform
+
+    def convert(self, values: list[float], from_unit: Unit, to_unit: Unit) -> list[float]:
+        scale, offset = self.get_transform(from_unit, to_unit)
+        return [value * scale + offset for value in values]
+
+    def search(self, query: str, dimension: Dimension | None = None) -> list[Unit]:
+        query = query.strip().lower()
+        return [
+            unit
+            for unit in self.__units.values()
+            if (dimension is None or unit.dimension == dimension)
+            and (query in unit.name.lower() or query == unit.symbol.lower())
+        ]
+
+
+FAHRENHEIT_SCALE = 5 / 9
+ZERO_CELSIUS_IN_KELVIN = 273.15
+
+DEFAULT_UNITS = [
+    Unit("kelvin", "K", Dimension.TEMPERATURE, 1),
+    Unit("celsius", "°C", Dimension.TEMPERATURE, 1, ZERO_CELSIUS_IN_KELVIN),
+    Unit("fahrenheit", "°F", Dimension.TEMPERATURE, FAHRENHEIT_SCALE, ZERO_CELSIUS_IN_KELVIN - 32 * FAHRENHEIT_SCALE),
+    Unit("rankine", "°R", Dimension.TEMPERATURE, FAHRENHEIT_SCALE),
+    Unit("millimeter", "mm", Dimension.LENGTH, 0.001),
+    Unit("centimeter", "cm", Dimension.LENGTH, 0.01),
+    Unit("meter", "m", Dimension.LENGTH, 1),
+    Unit("kilometer", "km", Dimension.LENGTH, 1000),
+    Unit("inch", "in", Dimension.LENGTH, 0.0254),
+    Unit("foot", "ft", Dimension.LENGTH, 0.3048),
+    Unit("yard", "yd", Dimension.LENGTH, 0.9144),
+    Unit("mile", "mi", Dimension.LENGTH, 1609.344),
+    Unit("nautical mile", "nmi", Dimension.LENGTH, 1852),
+    Unit("milligram", "mg", Dimension.MASS, 0.000001),
+    Unit("gram", "g", Dimension.MASS, 0.001),
+    Unit("kilogram", "kg", Dimension.MASS, 1),
+    Unit("tonne", "t", Dimension.MASS, 1000),
+    Unit("ounce", "oz", Dimension.MASS, 0.028349523125),
+    Unit("pound", "lb", Dimension.MASS, 0.45359237),
+    Unit("stone", "st", Dimension.MASS, 6.35029318),
+    Unit("milliliter", "ml", Dimension.VOLUME, 0.001),
+    Unit("liter", "l", Dimension.VOLUME, 1),
+    Unit("cubic meter", "m³", Dimension.VOLUME, 1000),
+    Unit("teaspoon", "tsp", Dimension.VOLUME, 0.00492892159375),
+    Unit("tablespoon", "tbsp", Dimension.VOLUME, 0.01478676478125),
+    Unit("fluid ounce", "fl oz", Dimension.VOLUME, 0.0295735295625),
+    Unit("cup", "cup", Dimension.VOLUME, 0.2365882365),
+    Unit("pint", "pt", Dimension.VOLUME, 0.473176473),
+    Unit("gallon", "gal", Dimension.VOLUME, 3.785411784),
+    Unit("imperial gallon", "imp gal", Dimension.VOLUME, 4.54609),
+    Unit("meter per second", "m/s", Dimension.SPEED, 1),
+    Unit("kilometer per hour", "km/h", Dimension.SPEED, 1 / 3.6),
+    Unit("mile per hour", "mph", Dimension.SPEED, 0.44704),
+    Unit("foot per second", "ft/s", Dimension.SPEED, 0.3048),
+    Unit("knot", "kn", Dimension.SPEED, 1852 / 3600),
+    Unit("bit", "bit", Dimension.DATA_SIZE, 0.125),
+    Unit("byte", "B", Dimension.DATA_SIZE, 1),
+    Unit("kilobyte", "kB", Dimension.DATA_SIZE, 1000),
+    Unit("megabyte", "MB", Dimension.DATA_SIZE, 1000**2),
+    Unit("gigabyte", "GB", Dimension.DATA_SIZE, 1000**3),
+    Unit("terabyte", "TB", Dimension.DATA_SIZE, 1000**4),
+    Unit("kibibyte", "KiB", Dimension.DATA_SIZE, 1024),
+    Unit("mebibyte", "MiB", Dimension.DATA_SIZE, 1024**2),
+    Unit("gibibyte", "GiB", Dimension.DATA_SIZE, 1024**3),
+    Unit("tebibyte", "TiB", Dimension.DATA_SIZE, 1024**4),
+]
+
+UNITS = UnitRegistry()
+for unit in DEFAULT_UNITS:
+    UNITS.register(unit)
@@ -1,74 +1,90 @@
-from enum import StrEnum
 from logging import getLogger
 
 from discord import ApplicationContext as AppCtx
-from discord import SlashCommandGroup, option
+from discord import AutocompleteContext, OptionChoice, option, slash_command
 
 from bot.classes.extension import Extension
 from bot.classes.incarn_bot import IncarnBot
 
+from ._units import UNITS, Unit
+
 log = getLogger(__name__)
 
+MAX_VALUES = 25
+MAX_AUTOCOMPLETE_RESULTS = 25
 
-class TemperatureUnits(StrEnum):
-    FAHRENHEIT = "fahrenheit"
-    CELSIUS = "celsius"
-    KELVIN = "kelvin"
 
+def get_unit_choices(units: list[Unit]) -> list[OptionChoice]:
+    return [OptionChoice(unit.display_name, unit.name) for unit in units[:MAX_AUTOCOMPLETE_RESULTS]]
 
-TEMPERATURE_UNITS = [temperature_unit.name.capitalize() for temperature_unit in TemperatureUnits]
 
+async def autocomplete_from_unit(ctx: AutocompleteContext) -> list[OptionChoice]:
+    return get_unit_choices(UNITS.search(ctx.value or ""))
 
-class Converters(Extension):
-    converters = SlashCommandGroup("convert", "Converts something to something.")
 
-    @converters.command(name="temperature", description="Converts temperature.")
-    @option("amount", description="Temperature value for conversion.")
-    @option("from_type", description="Initial unit of temperature.", choices=TEMPERATURE_UNITS)
-    @option("to_type", description="Converted unit of temperature.", choices=TEMPERATURE_UNITS)
+async def autocomplete_to_unit(ctx: AutocompleteContext) -> list[OptionChoice]:
+    try:
+        dimension = UNITS.get(ctx.options.get("from_unit") or "").dimension
+    except ValueError:
+        dimension = None
+    return get_unit_choices(UNITS.search(ctx.value or "", dimension))
+
+
+def parse_values(values: str) -> list[float]:
+    """
+    Parses a comma or space separated list of numbers.
+
+    :raises ValueError: A value is not a number or there are too many values.
+    """
+    items = values.replace(",", " ").split()
+    if not items:
+        message = "Provide at least one value."
+        raise ValueError(message)
+    if len(items) > MAX_VALUES:
+        message = f"Too many values. The maximum is {MAX_VALUES}."
+        raise ValueError(message)
+
+    try:
+        return [float(item) for item in items]
+    except ValueError:
+        message = "Values must be numbers."
+        raise ValueError(message) from None
+
+
+class Converters(Extension):
+    @slash_command(name="convert", description="Converts values from one unit to another.")
+    @option("values", description="Value or comma separated values for conversion.")
+    @option("from_unit", description="Initial unit.", autocomplete=autocomplete_from_unit)
+    @option("to_unit", description="Converted unit.", autocomplete=autocomplete_to_unit)
     @option("number_of_decimal_places", description="Number of digits after the decimal point.", choices=[1, 2, 3])
-    async def convert_temperature(
+    async def convert(
         self,
         ctx: AppCtx,
-        amount: float,
-        from_type: str,
-        to_type: str,
+        values: str,
+        from_unit: str,
+        to_unit: str,
         number_of_decimal_places: int = 1
     ) -> None:
-        absolute_zero_in_celsius = 273.15
+        try:
+            amounts = parse_values(values)
+            source, target = UNITS.get(from_unit), UNITS.get(to_unit)
+            results = UNITS.convert(amounts, source, target)
+        except ValueError as error:
+            await ctx.respond(str(error), ephemeral=True)
+            return
+
+        results = [round(result, number_of_decimal_places) for result in results]
 
-        from_type = from_type.lower()
-        to_type = to_type.lower()
+        log.debug("Converter: '%s' converts %s '%s' to %s '%s'", ctx.author.name, amounts, source, results, target)
 
-        if from_type == to_type:
-            await ctx.respond(f"Variables have one type - {from_type} and {to_type}. The answer is: `{amount}`")
+        if len(amounts) == 1:
+            await ctx.respond(f"`{amounts[0]:g}` {source.name} should be equal to `{results[0]}` {target.name}")
             return
 
-        result = 0
-        match from_type:
-            case TemperatureUnits.CELSIUS:
-                match to_type:
-                    case TemperatureUnits.FAHRENHEIT:
-                        result = round((amount * 1.8) + 32, number_of_decimal_places)
-                    case TemperatureUnits.KELVIN:
-                        result = round(amount + absolute_zero_in_celsius, number_of_decimal_places)
-
-            case TemperatureUnits.FAHRENHEIT:
-                match to_type:
-                    case TemperatureUnits.CELSIUS:
-                        result = round((amount - 32) / 1.8, number_of_decimal_places)
-                    case TemperatureUnits.KELVIN:
-                        result = round((amount - 32) * 5 / 9 + absolute_zero_in_celsius, number_of_decimal_places)
-
-            case TemperatureUnits.KELVIN:
-                match to_type:
-                    case TemperatureUnits.CELSIUS:
-                        result = round(amount - absolute_zero_in_celsius, number_of_decimal_places)
-                    case TemperatureUnits.FAHRENHEIT:
-                        result = round((amount - absolute_zero_in_celsius) * 1.8 + 32, number_of_decimal_places)
-
-        log.debug("Converter: '%s' converts %s '%s' to %s '%s'", ctx.author.name, amount, from_type, result, to_type)
-        await ctx.respond(f"`{amount}` {from_type} should be equal to `{result}` {to_type}")
+        lines = [
+            f"`{amount:g}` {source.symbol} = `{result}` {target.symbol}" for amount, result in zip(amounts, results)
+        ]
+        await ctx.respond(f"Converting {source.name} to {target.name}:\n" + "\n".join(lines))
 
 
 def setup(bot: IncarnBot):
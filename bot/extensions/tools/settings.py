@@ -0,0 +1,89 @@
+import re
+
+from discord import ApplicationContext as AppCtx
+from discord import Embed, Permissions, SlashCommandGroup, option
+
+from bot.classes.extension import Extension
+from bot.classes.incarn_bot import IncarnBot
+from bot.utils.guild_settings import GuildSettings
+
+HEX_COLOR_PATTERN = re.compile(r"^#?([0-9a-f]{6})$", re.IGNORECASE)
+COLOR_KINDS = {
+    "Embed": "embed_color",
+    "Success": "success_color",
+    "Failure": "failure_color",
+}
+MAX_DICE_CAP = 15
+
+
+def parse_color(value: str) -> int | None:
+    """
+    Parses a hex color like `#a0392b`. `default` resets the color.
+
+    :raises ValueError: The value is not a hex color.
+    """
+    if value.strip().lower() == "default":
+        return None
+
+    match = HEX_COLOR_PATTERN.match(value.strip())
+    if match is None:
+        message = f"Cannot parse color `{value}`. Use a hex color like `#a0392b` or `default`."
+        raise ValueError(message)
+    return int(match.group(1), 16)
+
+
+class Settings(Extension):
+    settings = SlashCommandGroup(
+        "settings",
+        "Server settings of the bot.",
+        guild_only=True,
+        default_member_permissions=Permissions(manage_guild=True),
+    )
+
+    def __get_settings_embed(self, settings: GuildSettings) -> Embed:
+        def color_string(color: int | None) -> str:
+            return f"#{color:06x}" if color is not None else "Default"
+
+        embed = Embed(title="Server settings", color=settings.get_color("embed", Embed.Empty))
+        embed.add_field(name="Hidden by default", value="Yes" if settings.hidden else "No")
+        embed.add_field(name="Dice cap", value=str(settings.dice_cap))
+        for name, field in COLOR_KINDS.items():
+            embed.add_field(name=f"{name} color", value=color_string(getattr(settings, field)))
+        return embed
+
+    @settings.command(name="show", description="Shows the server settings.")
+    async def settings_show(self, ctx: AppCtx) -> None:
+        settings = self.bot.guild_settings.get(ctx.guild_id)
+        await ctx.respond(embed=self.__get_settings_embed(settings), ephemeral=True)
+
+    @settings.command(name="hidden", description="Should command results be hidden by default?")
+    @option("value", description="Hide results by default.")
+    async def settings_hidden(self, ctx: AppCtx, value: bool) -> None:
+        assert ctx.guild_id
+        settings = await self.bot.guild_settings.update(ctx.guild_id, hidden=value)
+        await ctx.respond(embed=self.__get_settings_embed(settings), ephemeral=True)
+
+    @settings.command(name="dice_cap", description="Sets the maximum amount of dices per roll.")
+    @option("value", description="Maximum amount of dices.", min_value=1, max_value=MAX_DICE_CAP)
+    async def settings_dice_cap(self, ctx: AppCtx, value: int) -> None:
+        assert ctx.guild_id
+        settings = await self.bot.guild_settings.update(ctx.guild_id, dice_cap=value)
+        await ctx.respond(embed=self.__get_settings_embed(settings), ephemeral=True)
+
+    @settings.command(name="color", description="Sets an embed color.")
+    @option("kind", description="Which color to set.", choices=list(COLOR_KINDS))
+    @option("color", description="Hex color like #a0392b, or 'default'.")
+    async def settings_color(self, ctx: AppCtx, kind: str, color: str) -> None:
+        assert ctx.guild_id
+        try:
+            value = parse_color(color)
+        except ValueError as error:
+            await ctx.respond(str(error), ephemeral=True)
+            return
+
+        settings = await self.bot.guild_settings.update(ctx.guild_id, **{COLOR_KINDS[kind]: value})
+        await ctx.respond(embed=self.__get_settings_embed(settings), ephemeral=True)
+
+
+def setup(bot: IncarnBot) -> None:
+    bot.add_cog(Settings(bot))
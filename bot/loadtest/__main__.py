@@ -0,0 +1,37 @@
+import asyncio
+from argparse import ArgumentParser
+
+from bot import console
+
+from .harness import LoadTestHarness
+
+
+def parse_weights(value: str) -> dict[str, int]:
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        weights[name.strip()] = int(weight)
+    return weights
+
+
+async def main() -> None:
+    parser = ArgumentParser(prog="python -m bot.loadtest", description="Replays synthetic slash command traffic.")
+    parser.add_argument("--rate", type=float, default=50, help="Target requests per second.")
+    parser.add_argument("--duration", type=float, default=10, help="Test duration in seconds.")
+    parser.add_argument("--db-url", default="sqlite://:memory:", help="Tortoise database URL.")
+    parser.add_argument("--users", type=int, default=50, help="Number of synthetic users.")
+    parser.add_argument("--grudges", type=int, default=10, help="Seeded grudges per user.")
+    parser.add_argument("--mix", type=parse_weights, default=None, help="Weights, e.g. 'roll=5,grudge list=2'.")
+    args = parser.parse_args()
+
+    harness = LoadTestHarness(args.rate, args.duration, args.db_url, args.users, args.grudges, args.mix)
+    await harness.setup()
+    try:
+        await harness.run()
+    finally:
+        await harness.teardown()
+
+    harness.report(console)
+
+
+asyncio.run(main())
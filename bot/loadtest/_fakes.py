@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class FakeUser:
+    id: int
+    name: str
+
+    async def send(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+@dataclass
+class RecordedResponse:
+    content: str | None
+    kwargs: dict[str, Any]
+
+
+@dataclass
+class FakeResponse:
+    """
+    Stand-in for `discord.InteractionResponse` that records everything sent through it.
+    """
+    responses: list[RecordedResponse] = field(default_factory=list)
+    modals: list[Any] = field(default_factory=list)
+
+    async def send_message(self, content: str | None = None, **kwargs: Any) -> None:
+        self.responses.append(RecordedResponse(content, kwargs))
+
+    async def send_modal(self, modal: Any) -> None:
+        self.modals.append(modal)
+
+    async def defer(self, **kwargs: Any) -> None:
+        pass
+
+
+class FakeInteraction:
+    """
+    Stand-in for `discord.Interaction` without any gateway or HTTP state.
+    """
+
+    def __init__(self, user: FakeUser, guild_id: int | None = None) -> None:
+        self.user = user
+        self.guild_id = guild_id
+        self.channel_id = guild_id
+        self.response = FakeResponse()
+
+
+class FakeContext:
+    """
+    Stand-in for `discord.ApplicationContext` that is passed directly to command callbacks.
+    """
+
+    def __init__(self, user: FakeUser, guild_id: int | None = None) -> None:
+        self.author = user
+        self.user = user
+        self.guild_id = guild_id
+        self.channel_id = guild_id
+        self.interaction = FakeInteraction(user, guild_id)
+
+    @property
+    def responses(self) -> list[RecordedResponse]:
+        return self.interaction.response.responses
+
+    @property
+    def modals(self) -> list[Any]:
+        return self.interaction.response.modals
+
+    async def respond(self, content: str | None = None, **kwargs: Any) -> None:
+        await self.interaction.response.send_message(content, **kwargs)
+
+    async def send_modal(self, modal: Any) -> None:
+        await self.interaction.response.send_modal(modal)
+
+    async def defer(self, **kwargs: Any) -> None:
+        await self.interaction.response.defer(**kwargs)
@@ -0,0 +1,120 @@
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from ._fakes import FakeContext, FakeInteraction
+
+if TYPE_CHECKING:
+    from .harness import LoadTestHarness
+
+
+ScenarioRunner = Callable[["LoadTestHarness", FakeContext], Awaitable[None]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    weight: int
+    run: ScenarioRunner
+
+
+async def roll(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke("roll", ctx, amount=random.randint(1, 15), sides=random.choice([6, 10, 20, 100]), target=4)
+
+
+async def vtm_roll(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke(
+        "vtm roll",
+        ctx,
+        amount=random.randint(1, 15),
+        difficulty=random.randint(4, 9),
+        mod=random.randint(0, 3),
+        wounds=random.randint(0, 6),
+        special=random.choice([True, False]),
+    )
+
+
+async def vtm_soak(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke(
+        "vtm soak", ctx, damage=random.randint(1, 10), stamina=random.randint(1, 5), armor=1, mod=0, guaranteed=0
+    )
+
+
+async def dark_heresy_roll(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke("dark_heresy roll", ctx, target=random.randint(20, 60), mod=random.randint(-20, 20))
+
+
+async def dark_heresy_horde(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke("dark_heresy horde", ctx, tests=f"40+10x{random.randint(5, 30)}, 35x10")
+
+
+async def limbus_coinflip(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke("limbus coinflip", ctx, amount=random.randint(1, 5), power=4, coin_power=3)
+
+
+async def convert(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    from_unit, to_unit = random.sample(["celsius", "fahrenheit", "kelvin"], 2)
+    values = ", ".join(f"{random.uniform(-50, 50):.1f}" for _ in range(random.randint(1, 5)))
+    await harness.invoke("convert", ctx, values=values, from_unit=from_unit, to_unit=to_unit)
+
+
+async def revision(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke("revision", ctx)
+
+
+async def grudge_list(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke("grudge list", ctx, compact=True, hidden=True)
+
+
+async def grudge_stats(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke("grudge stats", ctx)
+
+
+async def grudge_add(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    await harness.invoke("grudge add", ctx)
+    await submit_modal(ctx, f"Grudge {random.randint(1, 10_000)}", "Synthetic load test grudge.")
+
+
+async def grudge_edit(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    grudge_id = harness.get_random_grudge_id(ctx.author.id)
+    if grudge_id is None:
+        return
+    await harness.invoke("grudge edit", ctx, grudge_id=grudge_id)
+    await submit_modal(ctx, f"Edited {random.randint(1, 10_000)}", "Edited by the load test.")
+
+
+async def grudge_mark_as_revenged(harness: "LoadTestHarness", ctx: FakeContext) -> None:
+    grudge_id = harness.get_random_grudge_id(ctx.author.id)
+    if grudge_id is None:
+        return
+    await harness.invoke("grudge mark_as_revenged", ctx, grudge_id=grudge_id)
+
+
+async def submit_modal(ctx: FakeContext, *values: str) -> None:
+    if not ctx.modals:
+        return
+
+    modal = ctx.modals[-1]
+    for child, value in zip(modal.children, values):
+        child.value = value
+
+    interaction = FakeInteraction(ctx.author, ctx.guild_id)
+    await modal.callback(interaction)
+    ctx.responses.extend(interaction.response.responses)
+
+
+SCENARIOS = [
+    Scenario("roll", 20, roll),
+    Scenario("vtm roll", 15, vtm_roll),
+    Scenario("vtm soak", 5, vtm_soak),
+    Scenario("dark_heresy roll", 10, dark_heresy_roll),
+    Scenario("dark_heresy horde", 3, dark_heresy_horde),
+    Scenario("limbus coinflip", 10, limbus_coinflip),
+    Scenario("convert", 5, convert),
+    Scenario("revision", 2, revision),
+    Scenario("grudge list", 15, grudge_list),
+    Scenario("grudge stats", 5, grudge_stats),
+    Scenario("grudge add", 8, grudge_add),
+    Scenario("grudge edit", 5, grudge_edit),
+    Scenario("grudge mark_as_revenged", 5, grudge_mark_as_revenged),
+]
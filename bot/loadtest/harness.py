@@ -0,0 +1,223 @@
+import asyncio
+import logging
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from logging import getLogger
+
+from discord import SlashCommand, SlashCommandGroup
+from rich.console import Console
+from rich.table import Table
+from tortoise import Tortoise
+
+from bot.classes.incarn_bot import IncarnBot
+from bot.models import GrudgeModel, UserModel
+from bot.utils import ExtensionLoader
+
+from ._fakes import FakeContext, FakeUser
+from ._scenarios import SCENARIOS, Scenario
+
+log = getLogger(__name__)
+
+current_scenario: ContextVar[str | None] = ContextVar("current_scenario", default=None)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class ScenarioStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    queries: int = 0
+    responses: int = 0
+
+
+class QueryCounter(logging.Handler):
+    """
+    Counts queries logged by the Tortoise database client and attributes them to the running scenario.
+    """
+
+    def __init__(self, stats: dict[str, ScenarioStats]) -> None:
+        super().__init__(logging.DEBUG)
+        self.stats = stats
+
+    def emit(self, record: logging.LogRecord) -> None:
+        scenario = current_scenario.get()
+        if scenario is not None:
+            self.stats[scenario].queries += 1
+
+
+class LoadTestHarness:
+    """
+    Replays synthetic slash command traffic against the real extensions without a gateway connection.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        duration: float,
+        db_url: str,
+        users: int = 50,
+        grudges_per_user: int = 10,
+        weights: dict[str, int] | None = None,
+    ) -> None:
+        self.rate = rate
+        self.duration = duration
+        self.db_url = db_url
+        self.users = [FakeUser(user_id, f"user-{user_id}") for user_id in range(1, users + 1)]
+        self.grudges_per_user = grudges_per_user
+        self.scenarios = self.__get_scenarios(weights or {})
+
+        self.bot: IncarnBot | None = None
+        self.commands: dict[str, SlashCommand] = {}
+        self.grudge_ids: dict[int, list[int]] = {}
+        self.stats: dict[str, ScenarioStats] = {scenario.name: ScenarioStats() for scenario in self.scenarios}
+        self.loop_lags: list[float] = []
+        self.elapsed = 0.0
+
+    @staticmethod
+    def __get_scenarios(weights: dict[str, int]) -> list[Scenario]:
+        if not weights:
+            return SCENARIOS
+
+        known = {scenario.name: scenario for scenario in SCENARIOS}
+        unknown = set(weights) - set(known)
+        if unknown:
+            message = f"Unknown scenarios: {', '.join(sorted(unknown))}"
+            raise ValueError(message)
+
+        return [Scenario(name, weight, known[name].run) for name, weight in weights.items() if weight > 0]
+
+    def get_random_grudge_id(self, user_id: int) -> int | None:
+        grudge_ids = self.grudge_ids.get(user_id)
+        return random.choice(grudge_ids) if grudge_ids else None
+
+    async def invoke(self, name: str, ctx: FakeContext, **kwargs) -> None:
+        await self.commands[name](ctx, **kwargs)
+
+    async def setup(self) -> None:
+        self.bot = IncarnBot()
+        ExtensionLoader.load_extensions(self.bot)
+
+        for command in self.bot.pending_application_commands:
+            if isinstance(command, SlashCommandGroup):
+                for subcommand in command.walk_commands():
+                    self.commands[subcommand.qualified_name] = subcommand
+            elif isinstance(command, SlashCommand):
+                self.commands[command.qualified_name] = command
+
+        missing = [scenario.name for scenario in self.scenarios if scenario.name not in self.commands]
+        if missing:
+            message = f"Commands are not loaded: {', '.join(missing)}"
+            raise RuntimeError(message)
+
+        await Tortoise.init(db_url=self.db_url, modules={"models": ["bot.models"]})
+        await Tortoise.generate_schemas()
+        await self.__seed()
+
+    async def __seed(self) -> None:
+        for user in self.users:
+            user_model, _ = await UserModel.get_or_create(user_id=user.id, defaults={"username": user.name})
+            await GrudgeModel.bulk_create(
+                [
+                    GrudgeModel(title=f"Seed {index}", content="Seeded by the load test.", user=user_model)
+                    for index in range(self.grudges_per_user)
+                ]
+            )
+            self.grudge_ids[user.id] = await GrudgeModel.filter(user_id=user.id).values_list("grudge_id", flat=True)
+
+    async def teardown(self) -> None:
+        await Tortoise.close_connections()
+
+    async def __run_scenario(self, scenario: Scenario) -> None:
+        ctx = FakeContext(random.choice(self.users), guild_id=1)
+        stats = self.stats[scenario.name]
+        token = current_scenario.set(scenario.name)
+        started = time.perf_counter()
+        try:
+            await scenario.run(self, ctx)
+        except Exception:
+            stats.errors += 1
+            log.exception("Scenario '%s' failed", scenario.name)
+        finally:
+            stats.latencies.append(time.perf_counter() - started)
+            stats.responses += len(ctx.responses)
+            current_scenario.reset(token)
+
+    async def __watch_loop_lag(self, interval: float = 0.05) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            self.loop_lags.append(max(0.0, time.perf_counter() - started - interval))
+
+    async def run(self) -> None:
+        db_log = getLogger("tortoise.db_client")
+        counter = QueryCounter(self.stats)
+        previous_level, previous_propagate = db_log.level, db_log.propagate
+        db_log.addHandler(counter)
+        db_log.setLevel(logging.DEBUG)
+        db_log.propagate = False
+
+        watcher = asyncio.create_task(self.__watch_loop_lag())
+        weights = [scenario.weight for scenario in self.scenarios]
+        tasks: set[asyncio.Task] = set()
+
+        started = time.perf_counter()
+        try:
+            total = int(self.rate * self.duration)
+            for index in range(total):
+                delay = started + index / self.rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                scenario = random.choices(self.scenarios, weights)[0]
+                task = asyncio.create_task(self.__run_scenario(scenario))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            self.elapsed = time.perf_counter() - started
+            watcher.cancel()
+            db_log.removeHandler(counter)
+            db_log.setLevel(previous_level)
+            db_log.propagate = previous_propagate
+
+    def report(self, console: Console) -> None:
+        table = Table(title=f"Load test: {self.rate:g} req/s for {self.duration:g}s")
+        for column in ["Command", "Count", "Errors", "p50 ms", "p95 ms", "p99 ms", "Queries/req", "Responses"]:
+            table.add_column(column, justify="left" if column == "Command" else "right")
+
+        total = 0
+        for name, stats in self.stats.items():
+            count = len(stats.latencies)
+            total += count
+            if not count:
+                continue
+            table.add_row(
+                name,
+                str(count),
+                str(stats.errors),
+                f"{percentile(stats.latencies, 50) * 1000:.2f}",
+                f"{percentile(stats.latencies, 95) * 1000:.2f}",
+                f"{percentile(stats.latencies, 99) * 1000:.2f}",
+                f"{stats.queries / count:.2f}",
+                str(stats.responses),
+            )
+
+        console.print(table)
+        console.print(f"Throughput: {total / self.elapsed if self.elapsed else 0:.1f} req/s ({total} requests)")
+        console.print(
+            "Event loop lag: "
+            f"p50 {percentile(self.loop_lags, 50) * 1000:.2f}ms | "
+            f"p99 {percentile(self.loop_lags, 99) * 1000:.2f}ms | "
+            f"max {max(self.loop_lags, default=0) * 1000:.2f}ms"
+        )
@@ -1,7 +1,17 @@
+from .archived_grudge import ArchivedGrudgeModel
 from .grudge import GrudgeModel
+from .grudge_stats import GrudgeStatsModel
+from .guild_settings import GuildSettingsModel
+from .initiative_snapshot import InitiativeSnapshotModel
+from .reminder import ReminderModel
 from .user import UserModel
 
 __all__ = [
     "UserModel",
-    "GrudgeModel"
+    "GrudgeModel",
+    "ArchivedGrudgeModel",
+    "GrudgeStatsModel",
+    "GuildSettingsModel",
+    "InitiativeSnapshotModel",
+    "ReminderModel"
 ]
@@ -0,0 +1,24 @@
+from typing import TYPE_CHECKING
+
+from tortoise import fields
+from tortoise.models import Model
+
+if TYPE_CHECKING:
+    from .user import UserModel
+
+
+class ArchivedGrudgeModel(Model):
+    grudge_id = fields.IntField(pk=True, unique=True, generated=False)
+    user: fields.ForeignKeyRelation["UserModel"] = fields.ForeignKeyField(
+        "models.UserModel", related_name="archived_grudges"
+    )
+    title = fields.CharField(max_length=100)
+    content = fields.CharField(max_length=300)
+    created_at = fields.DatetimeField()
+    revenged = fields.BooleanField(default=True)
+    revenged_at = fields.DatetimeField(null=True)
+    archived_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "grudge_archive"
+        table_description = "This table contains the old revenged grudges moved out of the grudge table."
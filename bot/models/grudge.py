@@ -4,6 +4,7 @@ from tortoise import fields
 from tortoise.models import Model
 
 if TYPE_CHECKING:
+    from .reminder import ReminderModel
     from .user import UserModel
 
 
@@ -16,6 +17,8 @@ class GrudgeModel(Model):
     revenged = fields.BooleanField(default=False)
     revenged_at = fields.DatetimeField(null=True)
 
+    reminders: fields.ReverseRelation["ReminderModel"]
+
     class Meta:
         table = "grudge"
         table_description = "This table contains the user records of the grudges extension."
@@ -0,0 +1,16 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class GrudgeStatsModel(Model):
+    user_id = fields.BigIntField(pk=True, unique=True)
+    total = fields.IntField(default=0)
+    revenged = fields.BigIntField(default=0)
+    revenge_seconds = fields.BigIntField(default=0)
+    average_revenge_seconds = fields.BigIntField(default=0)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "grudge_stats"
+        table_description = "This table contains per user aggregates of the grudges extension."
+        indexes = (("total", "user_id"), ("average_revenge_seconds", "user_id"))
@@ -0,0 +1,16 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class GuildSettingsModel(Model):
+    guild_id = fields.BigIntField(pk=True, unique=True)
+    hidden = fields.BooleanField(default=False)
+    dice_cap = fields.IntField(default=15)
+    embed_color = fields.IntField(null=True)
+    success_color = fields.IntField(null=True)
+    failure_color = fields.IntField(null=True)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "guild_settings"
+        table_description = "This table contains per guild settings of the bot."
@@ -0,0 +1,12 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class InitiativeSnapshotModel(Model):
+    channel_id = fields.BigIntField(pk=True, unique=True)
+    state = fields.JSONField()
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "initiative_snapshot"
+        table_description = "This table contains the last saved state of the initiative trackers."
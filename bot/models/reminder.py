@@ -0,0 +1,22 @@
+from typing import TYPE_CHECKING
+
+from tortoise import fields
+from tortoise.models import Model
+
+if TYPE_CHECKING:
+    from .grudge import GrudgeModel
+    from .user import UserModel
+
+
+class ReminderModel(Model):
+    reminder_id = fields.IntField(pk=True, unique=True)
+    grudge: fields.ForeignKeyRelation["GrudgeModel"] = fields.ForeignKeyField(
+        "models.GrudgeModel", related_name="reminders", on_delete=fields.CASCADE
+    )
+    user: fields.ForeignKeyRelation["UserModel"] = fields.ForeignKeyField("models.UserModel", related_name="reminders")
+    remind_at = fields.DatetimeField(index=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "grudge_reminder"
+        table_description = "This table contains the pending revenge reminders of the grudges extension."
@@ -1,6 +1,7 @@
 from tortoise import fields
 from tortoise.models import Model
 
+from .archived_grudge import ArchivedGrudgeModel
 from .grudge import GrudgeModel
 
 
@@ -10,6 +11,7 @@ class UserModel(Model):
     added_at = fields.DatetimeField(auto_now_add=True)
 
     grudges: fields.ReverseRelation["GrudgeModel"]
+    archived_grudges: fields.ReverseRelation["ArchivedGrudgeModel"]
 
     class Meta:
         table = "discord_user"
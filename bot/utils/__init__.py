@@ -1,9 +1,14 @@
 from .extension_loader import ExtensionLoader
 from .getters import get_quote, get_version
+from .loop_watchdog import LoopWatchdog, StallReport
+from .sampling_profiler import SamplingProfiler
 from .setup_logger import setup_logger
 
 __all__ = [
     "ExtensionLoader",
+    "LoopWatchdog",
+    "SamplingProfiler",
+    "StallReport",
     "get_quote",
     "get_version",
     "setup_logger"
@@ -0,0 +1,132 @@
+import hashlib
+import json
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from discord import ApplicationCommand, Bot
+
+log = getLogger(__name__)
+
+GLOBAL_SCOPE = "global"
+
+
+class CommandSync:
+    """
+    Syncs application commands only for scopes whose command tree changed since the last sync.
+
+    A scope is either the global commands or the commands of one guild. The hash of every scope
+    and the ids Discord gave its commands are persisted in `state_path`, so an unchanged scope
+    costs no HTTP calls at all on boot.
+    """
+
+    def __init__(self, bot: Bot, state_path: Path) -> None:
+        self.bot = bot
+        self.state_path = state_path
+
+    @staticmethod
+    def get_key(command_type: int, name: str) -> str:
+        return f"{command_type}:{name}"
+
+    @staticmethod
+    def get_hash(commands: list[ApplicationCommand]) -> str:
+        payload = sorted((command.to_dict() for command in commands), key=lambda command: command["name"])
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_scopes(self) -> dict[str, list[ApplicationCommand]]:
+        scopes: dict[str, list[ApplicationCommand]] = {}
+        for command in self.bot.pending_application_commands:
+            if command.guild_ids is None:
+                scopes.setdefault(GLOBAL_SCOPE, []).append(command)
+                continue
+            for guild_id in command.guild_ids:
+                scopes.setdefault(str(guild_id), []).append(command)
+        return scopes
+
+    def load_state(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as error:
+            log.warning("Cannot read command sync state, syncing everything: %s", error)
+            return {}
+
+    def save_state(self, state: dict[str, Any]) -> None:
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            self.state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        except OSError as error:
+            log.warning("Cannot save command sync state: %s", error)
+
+    async def __fetch(self, scope: str) -> list[dict[str, Any]]:
+        assert self.bot.user
+        if scope == GLOBAL_SCOPE:
+            return await self.bot.http.get_global_commands(self.bot.user.id)  # type: ignore
+        return await self.bot.http.get_guild_commands(self.bot.user.id, int(scope))  # type: ignore
+
+    async def __push(self, scope: str, commands: list[ApplicationCommand]) -> list[dict[str, Any]]:
+        # py-cord 2.4 deletes stale commands by a name tuple instead of the id in the individual mode,
+        # so the scope is replaced with one bulk request; it is skipped when nothing is out of sync.
+        guild_id = None if scope == GLOBAL_SCOPE else int(scope)
+        return await self.bot.register_commands(  # type: ignore
+            commands, guild_id=guild_id, method="bulk", delete_existing=True
+        )
+
+    async def __clear(self, scope: str) -> None:
+        assert self.bot.user
+        if scope == GLOBAL_SCOPE:
+            await self.bot.http.bulk_upsert_global_commands(self.bot.user.id, [])
+            return
+        await self.bot.http.bulk_upsert_guild_commands(self.bot.user.id, int(scope), [])
+
+    def __bind(self, commands: list[ApplicationCommand], ids: dict[str, str]) -> None:
+        for command in commands:
+            command_id = ids.get(self.get_key(command.type, command.name))
+            if command_id is None:
+                log.warning("Command '%s' is not registered", command.name)
+                continue
+            command.id = command_id
+            self.bot._application_commands[command_id] = command
+
+    async def sync(self, push: bool = True) -> None:
+        """
+        Binds registered command ids and pushes changed scopes.
+
+        :param bool push: Whether changed scopes should be pushed to Discord.
+            Otherwise the registered commands are only fetched to learn their ids.
+        """
+        assert self.bot.user
+        application_id = str(self.bot.application_id or self.bot.user.id)
+        state = self.load_state()
+        saved_scopes: dict[str, Any] = state.get(application_id, {})
+        scopes = self.get_scopes()
+
+        synced_scopes: dict[str, Any] = {}
+        pushed = skipped = 0
+        for scope, commands in scopes.items():
+            scope_hash = self.get_hash(commands)
+            saved = saved_scopes.get(scope)
+
+            if saved is not None and saved["hash"] == scope_hash:
+                ids = {key: str(command_id) for key, command_id in saved["commands"].items()}
+                skipped += 1
+            else:
+                registered = await self.__push(scope, commands) if push else await self.__fetch(scope)
+                ids = {self.get_key(item.get("type", 1), item["name"]): str(item["id"]) for item in registered}
+                pushed += push
+
+            self.__bind(commands, ids)
+            if push or saved is not None and saved["hash"] == scope_hash:
+                synced_scopes[scope] = {"hash": scope_hash, "commands": ids}
+
+        for scope in saved_scopes.keys() - scopes.keys():
+            if push:
+                await self.__clear(scope)
+                pushed += 1
+            else:
+                synced_scopes[scope] = saved_scopes[scope]
+
+        state[application_id] = synced_scopes
+        self.save_state(state)
+        log.info("Command sync: %s scopes pushed, %s scopes up to date", pushed, skipped)
@@ -0,0 +1,133 @@
+import asyncio
+from dataclasses import dataclass, fields
+from logging import getLogger
+from typing import Any
+
+import asyncpg
+from tortoise import Tortoise
+
+from ..config import DATABASE_CONFIG
+from ..models import GuildSettingsModel
+
+log = getLogger(__name__)
+
+NOTIFY_CHANNEL = "guild_settings"
+RECONNECT_DELAY = 5
+
+
+@dataclass(frozen=True)
+class GuildSettings:
+    hidden: bool = False
+    dice_cap: int = 15
+    embed_color: int | None = None
+    success_color: int | None = None
+    failure_color: int | None = None
+
+    def get_color(self, kind: str, default: Any) -> Any:
+        color = getattr(self, f"{kind}_color")
+        return color if color is not None else default
+
+    @classmethod
+    def from_model(cls, model: GuildSettingsModel) -> "GuildSettings":
+        return cls(**{field.name: getattr(model, field.name) for field in fields(cls)})
+
+
+DEFAULT_GUILD_SETTINGS = GuildSettings()
+
+
+class GuildSettingsCache:
+    """
+    Keeps every guild's settings in memory so commands never query them.
+
+    Writes go to the database and are announced with Postgres `NOTIFY`; every process listens
+    on the channel and reloads the guild that changed. SQLite deployments are single process,
+    so they only update the local cache.
+    """
+
+    def __init__(self) -> None:
+        self.__settings: dict[int, GuildSettings] = {}
+        self.__listener: asyncio.Task | None = None
+        self.__reloads: set[asyncio.Task] = set()
+
+    def get(self, guild_id: int | None) -> GuildSettings:
+        if guild_id is None:
+            return DEFAULT_GUILD_SETTINGS
+        return self.__settings.get(guild_id, DEFAULT_GUILD_SETTINGS)
+
+    async def load(self) -> None:
+        self.__settings = {model.guild_id: GuildSettings.from_model(model) for model in await GuildSettingsModel.all()}
+        log.debug("Guild settings: loaded %s guilds", len(self.__settings))
+
+    async def reload(self, guild_id: int) -> None:
+        model = await GuildSettingsModel.get_or_none(guild_id=guild_id)
+        if model is None:
+            self.__settings.pop(guild_id, None)
+        else:
+            self.__settings[guild_id] = GuildSettings.from_model(model)
+
+    async def update(self, guild_id: int, **values: Any) -> GuildSettings:
+        model, _ = await GuildSettingsModel.get_or_create(guild_id=guild_id)
+        model.update_from_dict(values)
+        await model.save()
+
+        self.__settings[guild_id] = GuildSettings.from_model(model)
+        if self.__is_postgres():
+            await Tortoise.get_connection("default").execute_query(
+                "SELECT pg_notify($1, $2)", [NOTIFY_CHANNEL, str(guild_id)]
+            )
+        return self.__settings[guild_id]
+
+    @staticmethod
+    def __is_postgres() -> bool:
+        return Tortoise.get_connection("default").capabilities.dialect == "postgres"
+
+    def start_listening(self) -> None:
+        if not self.__is_postgres():
+            return
+        if self.__listener is None or self.__listener.done():
+            self.__listener = asyncio.create_task(self.__listen(), name="guild-settings-listener")
+
+    def stop_listening(self) -> None:
+        if self.__listener is not None:
+            self.__listener.cancel()
+            self.__listener = None
+
+    def __on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            guild_id = int(payload)
+        except ValueError:
+            log.warning("Guild settings: unexpected notification payload '%s'", payload)
+            return
+        task = asyncio.create_task(self.reload(guild_id))
+        self.__reloads.add(task)
+        task.add_done_callback(self.__on_reload_done)
+
+    def __on_reload_done(self, task: asyncio.Task) -> None:
+        self.__reloads.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.warning("Guild settings: cannot reload settings: %s", task.exception())
+
+    async def __listen(self) -> None:
+        while True:
+            lost = asyncio.Event()
+            connection: asyncpg.Connection | None = None
+            try:
+                connection = await asyncpg.connect(
+                    host=DATABASE_CONFIG.host,
+                    port=DATABASE_CONFIG.port,
+                    user=DATABASE_CONFIG.username,
+                    password=DATABASE_CONFIG.password,
+                    database=DATABASE_CONFIG.database,
+                )
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(NOTIFY_CHANNEL, self.__on_notify)
+                # Anything changed while we were not listening is picked up by a full reload.
+                await self.load()
+                await lost.wait()
+                log.warning("Guild settings: listener connection lost, reconnecting")
+            except Exception as error:
+                log.warning("Guild settings: cannot listen for changes: %s", error)
+            finally:
+                if connection is not None:
+                    connection.terminate()
+            await asyncio.sleep(RECONNECT_DELAY)
@@ -0,0 +1,130 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from logging import getLogger
+from pathlib import Path
+
+log = getLogger(__name__)
+
+
+@dataclass
+class StallReport:
+    started_at: datetime
+    duration: float
+    command: str | None
+    task: str | None
+    stack: list[str]
+
+    def format(self) -> str:
+        header = (
+            f"[{self.started_at:%Y-%m-%d %H:%M:%S}] Event loop blocked for {self.duration * 1000:.0f}ms"
+            f" | command: {self.command or '-'} | task: {self.task or '-'}"
+        )
+        return header + "\n" + "".join(self.stack)
+
+
+class LoopWatchdog:
+    """
+    Measures event loop lag and captures the stack of whatever blocks the loop.
+
+    The loop bumps a heartbeat every `interval` seconds. A sidecar thread checks the heartbeat;
+    once it is older than `threshold`, the thread grabs the loop thread's current stack,
+    which is the callback that is blocking it.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        report_path: Path,
+        active_commands: dict[asyncio.Task, str],
+        interval: float = 0.05,
+        max_reports: int = 50,
+    ) -> None:
+        self.threshold = threshold
+        self.interval = interval
+        self.report_path = report_path
+        self.reports: deque[StallReport] = deque(maxlen=max_reports)
+        self.max_lag = 0.0
+
+        self.__active_commands = active_commands
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__loop_thread_id: int | None = None
+        self.__last_beat = time.monotonic()
+        self.__timer: asyncio.TimerHandle | None = None
+        self.__thread: threading.Thread | None = None
+        self.__stopped = threading.Event()
+
+    @property
+    def lag(self) -> float:
+        return max(0.0, time.monotonic() - self.__last_beat - self.interval)
+
+    def start(self) -> None:
+        if self.__thread is not None:
+            return
+
+        self.__loop = asyncio.get_running_loop()
+        self.__loop_thread_id = threading.get_ident()
+        self.__stopped.clear()
+        self.__beat()
+
+        self.__thread = threading.Thread(target=self.__watch, name="loop-watchdog", daemon=True)
+        self.__thread.start()
+        log.debug("Loop watchdog started with %sms threshold", round(self.threshold * 1000))
+
+    def stop(self) -> None:
+        self.__stopped.set()
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        self.__thread = None
+
+    def __beat(self) -> None:
+        self.__last_beat = time.monotonic()
+        assert self.__loop
+        self.__timer = self.__loop.call_later(self.interval, self.__beat)
+
+    def __capture(self) -> StallReport:
+        assert self.__loop and self.__loop_thread_id
+        frame = sys._current_frames().get(self.__loop_thread_id)
+        stack = traceback.format_stack(frame) if frame is not None else []
+
+        task = asyncio.current_task(self.__loop)
+        return StallReport(
+            started_at=datetime.now(),
+            duration=self.lag,
+            command=self.__active_commands.get(task) if task is not None else None,
+            task=task.get_name() if task is not None else None,
+            stack=stack,
+        )
+
+    def __finish(self, report: StallReport, duration: float) -> None:
+        report.duration = duration
+        self.reports.append(report)
+        self.max_lag = max(self.max_lag, duration)
+
+        log.warning(
+            "Event loop was blocked for %sms by '%s'", round(duration * 1000), report.command or report.task or "-"
+        )
+        try:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.report_path.open("a", encoding="utf-8") as file:
+                file.write(report.format() + "\n")
+        except OSError as error:
+            log.warning("Cannot write stall report: %s", error)
+
+    def __watch(self) -> None:
+        report: StallReport | None = None
+        while not self.__stopped.wait(self.interval):
+            lag = self.lag
+            if report is None and lag > self.threshold:
+                report = self.__capture()
+            elif report is not None and lag <= self.threshold:
+                self.__finish(report, report.duration)
+                report = None
+            elif report is not None:
+                report.duration = max(report.duration, lag)
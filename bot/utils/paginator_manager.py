@@ -0,0 +1,180 @@
+import json
+import secrets
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any, Awaitable, Callable
+
+from discord import Interaction, InteractionType
+from discord.ext.pages import Page, Paginator
+
+log = getLogger(__name__)
+
+CUSTOM_ID_PREFIX = "pages"
+# Rough size of a paginator, its buttons and the view store entries without the page content.
+PAGINATOR_OVERHEAD = 4096
+
+Rebuilder = Callable[[int, Any], Awaitable[Paginator | None]]
+
+
+@dataclass
+class LivePaginator:
+    paginator: "ManagedPaginator"
+    key: str
+    user_id: int
+    state: Any
+    size: int
+
+
+@dataclass
+class EvictedPaginator:
+    key: str
+    user_id: int
+    state: Any
+    page: int
+
+
+class ManagedPaginator(Paginator):
+    def __init__(self, manager: "PaginatorManager", token: str, pages: list[Page], **kwargs: Any) -> None:
+        super().__init__(pages, timeout=manager.timeout, disable_on_timeout=False, **kwargs)
+        self.manager = manager
+        self.token = token
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        self.manager.touch(self.token)
+        return await super().interaction_check(interaction)
+
+    async def on_timeout(self) -> None:
+        self.manager.release(self.token)
+
+
+class PaginatorManager:
+    """
+    Bounds the amount of live paginator views.
+
+    Every paginator is closed after `timeout` seconds without clicks, and the least recently used one is closed
+    when a user has more than `max_per_user` or everyone has more than `max_total`. The buttons of a closed
+    paginator stay on its message; a click on them rebuilds the paginator with the rebuilder registered for its key.
+    """
+
+    def __init__(
+        self, max_per_user: int = 3, max_total: int = 200, timeout: float = 300, max_evicted: int = 1000
+    ) -> None:
+        self.max_per_user = max_per_user
+        self.max_total = max_total
+        self.timeout = timeout
+        self.max_evicted = max_evicted
+        self.__live: OrderedDict[str, LivePaginator] = OrderedDict()
+        self.__evicted: OrderedDict[int, EvictedPaginator] = OrderedDict()
+        self.__rebuilders: dict[str, Rebuilder] = {}
+
+    def add_rebuilder(self, key: str, rebuilder: Rebuilder) -> None:
+        self.__rebuilders[key] = rebuilder
+
+    def remove_rebuilder(self, key: str) -> None:
+        self.__rebuilders.pop(key, None)
+
+    def create(self, key: str, user_id: int, state: Any, pages: list[Page], **kwargs: Any) -> ManagedPaginator:
+        """
+        Creates a paginator and closes the least recently used ones that exceed the limits.
+
+        :param key: Key of the rebuilder that can create this paginator again.
+        :param user_id: User who owns the paginator.
+        :param state: Value that is passed to the rebuilder, it must be enough to fetch the pages again.
+        :param pages: Pages of the paginator.
+        :return: Paginator which buttons are recognized by the manager.
+        """
+        token = secrets.token_hex(8)
+        paginator = ManagedPaginator(self, token, pages, **kwargs)
+        for button_type, button in paginator.buttons.items():
+            button["object"].custom_id = f"{CUSTOM_ID_PREFIX}:{key}:{token}:{button_type}"
+
+        size = PAGINATOR_OVERHEAD + sum(
+            len(json.dumps(embed.to_dict())) for page in paginator.pages for embed in page.embeds
+        )
+        self.__live[token] = LivePaginator(paginator, key, user_id, state, size)
+
+        owned = [live.paginator.token for live in self.__live.values() if live.user_id == user_id]
+        for owned_token in owned[:-self.max_per_user]:
+            self.release(owned_token)
+        while len(self.__live) > self.max_total:
+            self.release(next(iter(self.__live)))
+
+        return paginator
+
+    def touch(self, token: str) -> None:
+        if token in self.__live:
+            self.__live.move_to_end(token)
+
+    def release(self, token: str) -> None:
+        """
+        Closes the live paginator and remembers its message, so a later click can rebuild it.
+        """
+        live = self.__live.pop(token, None)
+        if live is None:
+            return
+
+        live.paginator.stop()
+        message = live.paginator.message
+        if message is None:
+            return
+
+        self.__evicted[message.id] = EvictedPaginator(live.key, live.user_id, live.state, live.paginator.current_page)
+        while len(self.__evicted) > self.max_evicted:
+            self.__evicted.popitem(last=False)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "live": len(self.__live),
+            "users": len({live.user_id for live in self.__live.values()}),
+            "evicted": len(self.__evicted),
+            "estimated_bytes": sum(live.size for live in self.__live.values()),
+        }
+
+    async def rebuild(self, interaction: Interaction) -> bool:
+        """
+        Handles clicks on buttons of paginators that are not live anymore.
+
+        :param interaction: Any interaction received by the bot.
+        :return: Whether the interaction was handled.
+        """
+        if interaction.type != InteractionType.component or interaction.message is None:
+            return False
+
+        custom_id = str((interaction.data or {}).get("custom_id", ""))
+        parts = custom_id.split(":")
+        if len(parts) != 4 or parts[0] != CUSTOM_ID_PREFIX or parts[2] in self.__live:
+            return False
+
+        _, key, _, button_type = parts
+        evicted = self.__evicted.get(interaction.message.id)
+        rebuilder = self.__rebuilders.get(key)
+        if evicted is None or rebuilder is None:
+            await interaction.response.send_message("This list has expired, use the command again.", ephemeral=True)
+            return True
+
+        if interaction.user is None or interaction.user.id != evicted.user_id:
+            await interaction.response.send_message("This list belongs to someone else.", ephemeral=True)
+            return True
+
+        # Removed before the rebuild is awaited, so a quick second click cannot rebuild the paginator twice.
+        del self.__evicted[interaction.message.id]
+        paginator = await rebuilder(evicted.user_id, evicted.state)
+        if paginator is None:
+            await interaction.response.send_message("There is nothing to show anymore.", ephemeral=True)
+            return True
+
+        paginator.user = interaction.user
+        paginator.message = interaction.message
+
+        page = {
+            "first": 0,
+            "prev": evicted.page - 1,
+            "next": evicted.page + 1,
+            "last": paginator.page_count,
+        }.get(button_type, evicted.page)
+        paginator.current_page = max(0, min(page, paginator.page_count))
+        log.debug("Paginators: rebuilt '%s' of user %s on page %s", key, evicted.user_id, paginator.current_page)
+
+        await paginator.goto_page(paginator.current_page, interaction=interaction)
+        return True
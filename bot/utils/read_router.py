@@ -0,0 +1,68 @@
+from logging import getLogger
+from time import monotonic
+from typing import Any
+
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.exceptions import ConfigurationError, DoesNotExist, MultipleObjectsReturned
+from tortoise.queryset import QuerySet
+
+log = getLogger(__name__)
+
+REPLICA_CONNECTION = "replica"
+
+
+class ReadRouter:
+    """
+    Sends read-only queries to the read replica and everything else to the primary.
+
+    A user whose data was written less than `read_after_write` seconds ago reads from the primary,
+    so they never see the replica lagging behind their own changes. When a replica query fails for any
+    reason other than its result, the replica is skipped for `cooldown` seconds and the query is repeated
+    on the primary.
+    """
+
+    def __init__(self, read_after_write: float, cooldown: float = 30) -> None:
+        self.__read_after_write = read_after_write
+        self.__cooldown = cooldown
+        self.__written_until: dict[int, float] = {}
+        self.__failed_until = 0.0
+
+    def mark_written(self, user_id: int) -> None:
+        now = monotonic()
+        self.__written_until[user_id] = now + self.__read_after_write
+        if len(self.__written_until) > 1024:
+            self.__written_until = {user: until for user, until in self.__written_until.items() if until > now}
+
+    async def read(self, query: QuerySet, user_id: int | None = None) -> Any:
+        """
+        Executes the query on the replica when it is allowed, otherwise on the primary.
+
+        :param query: Read-only query.
+        :param user_id: User whose data is read, to keep their own writes visible.
+        :return: Result of the query.
+        """
+        replica = self.__get_replica(user_id)
+        if replica is None:
+            return await query
+
+        try:
+            return await query.using_db(replica)
+        except (DoesNotExist, MultipleObjectsReturned):
+            raise
+        except Exception as error:
+            self.__failed_until = monotonic() + self.__cooldown
+            log.warning("Read replica failed, reading from the primary for %ss: %s", self.__cooldown, error)
+        return await query
+
+    def __get_replica(self, user_id: int | None) -> BaseDBAsyncClient | None:
+        now = monotonic()
+        if now < self.__failed_until:
+            return None
+        if user_id is not None and self.__written_until.get(user_id, 0) > now:
+            return None
+
+        try:
+            return Tortoise.get_connection(REPLICA_CONNECTION)
+        except ConfigurationError:
+            return None
@@ -0,0 +1,76 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Callable
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler that samples the event loop thread from a separate thread.
+
+    Nothing runs outside of `run`, so the profiler costs nothing while it is off.
+    Samples are attributed to the slash command and extension running in the current task
+    and are returned in the collapsed stack format used by flamegraph tools.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        loop_thread_id: int,
+        active_commands: dict[asyncio.Task, str],
+        get_extension: Callable[[str], str | None],
+        interval: float = 0.005,
+    ) -> None:
+        self.loop = loop
+        self.loop_thread_id = loop_thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+
+        self.__active_commands = active_commands
+        self.__get_extension = get_extension
+
+    @staticmethod
+    def get_frame_name(frame: FrameType) -> str:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        return f"{module}:{code.co_name}:{frame.f_lineno}"
+
+    def __sample(self) -> None:
+        frame = sys._current_frames().get(self.loop_thread_id)
+        if frame is None:
+            return
+
+        stack = []
+        while frame is not None:
+            stack.append(self.get_frame_name(frame))
+            frame = frame.f_back
+        stack.reverse()
+
+        task = asyncio.current_task(self.loop)
+        command = self.__active_commands.get(task) if task is not None else None
+        if command is None:
+            prefix = ["idle" if task is None else "task:" + task.get_name()]
+        else:
+            prefix = [f"ext:{self.__get_extension(command) or '-'}", f"cmd:{command}"]
+
+        self.samples[";".join(prefix + stack)] += 1
+
+    def run(self, seconds: float) -> str:
+        """
+        Samples the loop thread for `seconds` and returns the collapsed stacks.
+
+        Blocks the calling thread, so it must not be called from the event loop thread.
+        """
+        if threading.get_ident() == self.loop_thread_id:
+            message = "The profiler cannot sample the thread it runs in."
+            raise RuntimeError(message)
+
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self.__sample()
+            time.sleep(self.interval)
+
+        return "\n".join(f"{stack} {count}" for stack, count in self.samples.most_common())